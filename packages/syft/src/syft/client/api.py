@@ -308,7 +308,8 @@ def generate_remote_lib_function(
         )
         service_args = [action]
         # TODO: implement properly
-        TraceResult.result += [action]
+        if TraceResult._client is not None:
+            TraceResult.result.append(action)
 
         api_call = SyftAPICall(
             node_uid=wrapper_node_uid,
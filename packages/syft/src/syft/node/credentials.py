@@ -41,7 +41,9 @@ class SyftVerifyKey(SyftBaseModel):
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, SyftVerifyKey):
             return False
-        return self.verify_key == other.verify_key
+        # VerifyKey.__eq__ does a constant time compare through libsodium, which is
+        # slow and not needed for public keys
+        return bytes(self.verify_key) == bytes(other.verify_key)
 
     def __repr__(self) -> str:
         return str(self)
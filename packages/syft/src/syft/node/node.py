@@ -5,6 +5,7 @@ from __future__ import annotations
 import binascii
 import contextlib
 from datetime import datetime
+from functools import lru_cache
 from functools import partial
 import hashlib
 from multiprocessing import current_process
@@ -16,6 +17,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 import uuid
@@ -179,6 +181,16 @@ default_root_email = get_default_root_email()
 default_root_password = get_default_root_password()
 
 
+@lru_cache(maxsize=1024)
+def split_service_path(path: str) -> Tuple[str, str]:
+    # every api call resolves its path, only split each path once. The cache
+    # is kept off the node so it never ends up in the node's serialized state
+    path_list = path.split(".")
+    method_name = path_list.pop()
+    service_name = path_list.pop() if path_list else method_name
+    return service_name.lower(), method_name
+
+
 @instrument
 class Node(AbstractNode):
     signing_key: Optional[SyftSigningKey]
@@ -542,18 +554,12 @@ class Node(AbstractNode):
         return self._get_service_from_path(path_or_func)
 
     def _get_service_from_path(self, path: str) -> AbstractService:
-        path_list = path.split(".")
-        if len(path_list) > 1:
-            _ = path_list.pop()
-        service_name = path_list.pop()
-        return self.service_path_map[service_name.lower()]
+        service_name, _ = split_service_path(path)
+        return self.service_path_map[service_name]
 
     def _get_service_method_from_path(self, path: str) -> Callable:
-        path_list = path.split(".")
-        method_name = path_list.pop()
-        service_obj = self._get_service_from_path(path=path)
-
-        return getattr(service_obj, method_name)
+        service_name, method_name = split_service_path(path)
+        return getattr(self.service_path_map[service_name], method_name)
 
     @property
     def metadata(self) -> NodeMetadata:
@@ -36,18 +36,21 @@ def arrow_deserialize(
     original_dtype = np.dtype(dtype)
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
         reader = pa.BufferReader(numpy_bytes)
-        numpy_bytes = reader.read_buffer()
-    else:
-        numpy_bytes = pa.decompress(
-            numpy_bytes,
-            decompressed_size=decompressed_size,
-            codec=flags.APACHE_ARROW_COMPRESSION.value,
-        )
-
+        result = pa.ipc.read_tensor(reader.read_buffer())
+        # the tensor is a view of the serialized bytes, copy it out
+        return result.to_numpy().astype(original_dtype)
+
+    numpy_bytes = pa.decompress(
+        numpy_bytes,
+        decompressed_size=decompressed_size,
+        codec=flags.APACHE_ARROW_COMPRESSION.value,
+    )
     result = pa.ipc.read_tensor(numpy_bytes)
     np_array = result.to_numpy()
     np_array.setflags(write=True)
-    return np_array.astype(original_dtype)
+    # the decompressed buffer is only referenced by this array, only copy
+    # when the dtype actually has to change
+    return np_array.astype(original_dtype, copy=False)
 
 
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
@@ -85,8 +88,9 @@ def arraytonumpyutf8(string_list: Union[str, np.ndarray]) -> bytes:
     Returns:
         bytes: serialized utf-8 encoded int Numpy array
     """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
+    string_list = np.asarray(string_list)
+    array_shape = string_list.shape
+    string_list = string_list.ravel()
     bytes_list = []
     indexes = []
     offset = 0
@@ -97,15 +101,18 @@ def arraytonumpyutf8(string_list: Union[str, np.ndarray]) -> bytes:
         indexes.append(offset)
         bytes_list.append(name_bytes)
 
+    # layout: [bytes, indexes, len(indexes), shape, len(shape)], each section is
+    # written straight into the output instead of being built and concatenated
     np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
-    index_length = np.array([len(np_indexes)], dtype=np.uint64)
-    shape = np.array(array_shape, dtype=np.uint64)
-    shape_length = np.array([len(shape)], dtype=np.uint64)
-    output_array = np.concatenate(
-        [np_bytes, np_indexes, index_length, shape, shape_length]
-    )
+    bytes_end = len(np_bytes)
+    index_end = bytes_end + len(indexes)
+    shape_end = index_end + 1 + len(array_shape)
+    output_array = np.empty(shape_end + 1, dtype=np.uint64)
+    output_array[:bytes_end] = np_bytes
+    output_array[bytes_end:index_end] = indexes
+    output_array[index_end] = len(indexes)
+    output_array[index_end + 1 : shape_end] = array_shape  # noqa
+    output_array[shape_end] = len(array_shape)
 
     return cast(bytes, _serialize(output_array, to_bytes=True))
 
@@ -4,16 +4,16 @@ from typing import Any
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
+# relative
+from .recursive import rs_bytes2object
+from .recursive import rs_proto2object
+
 
 def _deserialize(
     blob: Any,
     from_proto: bool = True,
     from_bytes: bool = False,
 ) -> Any:
-    # relative
-    from .recursive import rs_bytes2object
-    from .recursive import rs_proto2object
-
     if (
         (from_bytes and not isinstance(blob, bytes))
         or (
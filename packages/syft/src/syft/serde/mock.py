@@ -1,6 +1,6 @@
 # stdlib
 from collections import defaultdict
-import secrets
+import random
 from typing import Any
 from typing import Dict
 from typing import List
@@ -17,10 +17,13 @@ class CachedFaker:
     def __init__(self) -> None:
         self.fake = Faker()
         self.cache: Dict[str, List[Any]] = defaultdict(list)
+        # mocks don't need a CSPRNG, a seeded generator per instance avoids
+        # a urandom syscall for every sample drawn from the cache
+        self.rng = random.Random()  # nosec
 
     def __getattr__(self, name: str) -> Any:
-        if len(self.cache.get(name, [])) > 100:
-            return lambda: secrets.choice(self.cache[name])
+        if len(self.cache.get(name, ())) > 100:
+            return lambda: self.rng.choice(self.cache[name])
         else:
 
             def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -5,9 +5,11 @@ import sys
 import types
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -15,18 +17,26 @@ from typing import Union
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..util.util import get_fully_qualified_name
 from ..util.util import index_syft_by_module_name
 from .capnp import get_capnp_schema
 
 TYPE_BANK = {}
+# fqn -> (TYPE_BANK entry, sorted field names), see get_field_names
+FIELD_NAMES_CACHE: Dict[str, Tuple[tuple, List[str]]] = {}
+# same as FIELD_NAMES_CACHE, without the attributes excluded from hashing
+HASH_FIELD_NAMES_CACHE: Dict[str, Tuple[tuple, List[str]]] = {}
+# fqn -> (TYPE_BANK entry, class resolved on deserialization)
+CLASS_TYPE_CACHE: Dict[str, Tuple[tuple, Type]] = {}
 
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde  # type: ignore
 
+# capnp messages are read without a traversal limit
+MAX_TRAVERSAL_LIMIT = 2**64 - 1
+# capnp max for a List(Data) field
+CHUNK_SIZE = int(5.12e8)
+
 
 def get_types(cls: Type, keys: Optional[List[str]] = None) -> Optional[List[Type]]:
     if keys is None:
@@ -159,29 +169,48 @@ def recursive_serde_register(
 def chunk_bytes(
     data: bytes, field_name: Union[str, int], builder: _DynamicStructBuilder
 ) -> None:
-    CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
     list_size = len(data) // CHUNK_SIZE + 1
     data_lst = builder.init(field_name, list_size)
-    END_INDEX = CHUNK_SIZE
+    if list_size == 1:
+        data_lst[0] = data
+        return
+    # slices of a memoryview don't copy, capnp copies each chunk into the message
+    data_view = memoryview(data)
     for idx in range(list_size):
         START_INDEX = idx * CHUNK_SIZE
         END_INDEX = min(START_INDEX + CHUNK_SIZE, len(data))
-        data_lst[idx] = data[START_INDEX:END_INDEX]
+        data_lst[idx] = data_view[START_INDEX:END_INDEX]
 
 
 def combine_bytes(capnp_list: List[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # join sizes the output once, repeated += copies everything read so far
+    # for every chunk. a single chunk is returned as is
+    return b"".join(capnp_list)
+
+
+def get_field_names(
+    fqn: str, serde_attributes: tuple, for_hashing: bool = False
+) -> List[str]:
+    # the fields written for a registered class are the same for every instance,
+    # so they are only filtered and sorted once per TYPE_BANK entry
+    cache = HASH_FIELD_NAMES_CACHE if for_hashing else FIELD_NAMES_CACHE
+    cached = cache.get(fqn, None)
+    if cached is None or cached[0] is not serde_attributes:
+        attribute_list, exclude_attrs_list = serde_attributes[3], serde_attributes[4]
+        exclude_attrs_set = set(exclude_attrs_list)
+        if for_hashing:
+            # relative
+            from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+            exclude_attrs_set.update(serde_attributes[6])
+            exclude_attrs_set.update(DYNAMIC_SYFT_ATTRIBUTES)
+        field_names = sorted(set(attribute_list) - exclude_attrs_set)
+        cached = (serde_attributes, field_names)
+        cache[fqn] = cached
+    return cached[1]
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
-
     is_type = False
     if isinstance(self, type):
         is_type = True
@@ -193,6 +222,7 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
         raise Exception(f"{fqn} not in TYPE_BANK")
 
     msg.fullyQualifiedName = fqn
+    serde_attributes = TYPE_BANK[fqn]
     (
         nonrecursive,
         serialize,
@@ -203,7 +233,7 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
         hash_exclude_attrs,
         cls,
         attribute_types,
-    ) = TYPE_BANK[fqn]
+    ) = serde_attributes
 
     if nonrecursive or is_type:
         if serialize is None:
@@ -213,22 +243,28 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
         chunk_bytes(serialize(self), "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
+    if attribute_list is not None:
+        field_names = get_field_names(fqn, serde_attributes, for_hashing=for_hashing)
+    else:
         attribute_list = self.__dict__.keys()
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
+        if for_hashing:
+            # relative
+            from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+            hash_exclude_attrs_set = set(hash_exclude_attrs).union(
+                set(DYNAMIC_SYFT_ATTRIBUTES)
+            )
+        else:
+            hash_exclude_attrs_set = set()
+        field_names = sorted(
+            set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
+        )
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
+    msg.init("fieldsName", len(field_names))
+    msg.init("fieldsData", len(field_names))
+
+    for idx, attr_name in enumerate(field_names):
         if not hasattr(self, attr_name):
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
@@ -243,7 +279,7 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
         if isinstance(field_obj, types.FunctionType):
             continue
 
-        serialized = sy.serialize(field_obj, to_bytes=True, for_hashing=for_hashing)
+        serialized = rs_object2proto(field_obj, for_hashing=for_hashing).to_bytes()
         msg.fieldsName[idx] = attr_name
         chunk_bytes(serialized, idx, msg.fieldsData)
 
@@ -251,31 +287,26 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
 
 
 def rs_bytes2object(blob: bytes) -> Any:
-    MAX_TRAVERSAL_LIMIT = 2**64 - 1
-
     with recursive_scheme.from_bytes(  # type: ignore
         blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
         return rs_proto2object(msg)
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
-
+def get_class_type(fqn: str) -> Type:
     # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
+    module_parts = fqn.split(".")
     klass = module_parts.pop()
     class_type: Type = type(None)
 
     if klass != "NoneType":
         try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore
+            class_type = index_syft_by_module_name(fqn)  # type: ignore
         except Exception:  # nosec
             try:
                 class_type = getattr(sys.modules[".".join(module_parts)], klass)
             except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
+                if "syft.user" in fqn:
                     # relative
                     from ..node.node import CODE_RELOADER
 
@@ -286,8 +317,23 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
                 except Exception:  # nosec
                     pass
 
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
+    return class_type
+
+
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    fqn = proto.fullyQualifiedName
+    cached = CLASS_TYPE_CACHE.get(fqn, None)
+    cache_hit = cached is not None and cached[0] is TYPE_BANK.get(fqn, None)
+    class_type = cached[1] if cache_hit else get_class_type(fqn)
+
+    if fqn not in TYPE_BANK:
+        raise Exception(f"{fqn} not in TYPE_BANK")
+
+    serde_attributes = TYPE_BANK[fqn]
+    # resolving a class walks the module tree and usually raises on the way, so
+    # only do it once per registered type. user code classes can be reloaded
+    if not cache_hit and class_type != type(None) and "syft.user" not in fqn:
+        CLASS_TYPE_CACHE[fqn] = (serde_attributes, class_type)
 
     # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
     # module name space in sub-processes or threads even though they are loaded on start
@@ -304,7 +350,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         hash_exclude_attrs,
         cls,
         attribute_types,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
+    ) = serde_attributes
 
     if class_type == type(None):
         # yes this looks stupid but it works and the opposite breaks
@@ -323,7 +369,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         if attr_name != "":
             attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
+            attr_value = rs_bytes2object(attr_bytes)
             transforms = serde_overrides.get(attr_name, None)
 
             if transforms is not None:
@@ -339,7 +385,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         # if we skip the __new__ flow of BaseModel we get the error
         # AttributeError: object has no attribute '__fields_set__'
 
-        if "syft.user" in proto.fullyQualifiedName:
+        if "syft.user" in fqn:
             # weird issues with pydantic and ForwardRef on user classes being inited
             # with custom state args / kwargs
             obj = class_type()
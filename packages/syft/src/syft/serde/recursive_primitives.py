@@ -23,10 +23,15 @@ from typing import cast
 import weakref
 
 # relative
+from ..util.util import full_name_with_name
+from ..util.util import full_name_with_qualname
 from .capnp import get_capnp_schema
+from .deserialize import _deserialize
+from .recursive import MAX_TRAVERSAL_LIMIT
 from .recursive import chunk_bytes
 from .recursive import combine_bytes
 from .recursive import recursive_serde_register
+from .serialize import _serialize
 
 # import types unsupported on python 3.8
 if sys.version_info >= (3, 9):
@@ -40,9 +45,6 @@ kv_iterable_schema = get_capnp_schema("kv_iterable.capnp").KVIterable  # type: i
 
 
 def serialize_iterable(iterable: Collection) -> bytes:
-    # relative
-    from .serialize import _serialize
-
     message = iterable_schema.new_message()
 
     message.init("values", len(iterable))
@@ -55,10 +57,6 @@ def serialize_iterable(iterable: Collection) -> bytes:
 
 
 def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
-    # relative
-    from .deserialize import _deserialize
-
-    MAX_TRAVERSAL_LIMIT = 2**64 - 1
     values = []
 
     with iterable_schema.from_bytes(  # type: ignore
@@ -71,9 +69,6 @@ def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
 
 
 def serialize_kv(map: Mapping) -> bytes:
-    # relative
-    from .serialize import _serialize
-
     message = kv_iterable_schema.new_message()
 
     message.init("keys", len(map))
@@ -88,10 +83,6 @@ def serialize_kv(map: Mapping) -> bytes:
 
 
 def get_deserialized_kv_pairs(blob: bytes) -> List[Any]:
-    # relative
-    from .deserialize import _deserialize
-
-    MAX_TRAVERSAL_LIMIT = 2**64 - 1
     pairs = []
 
     with kv_iterable_schema.from_bytes(  # type: ignore
@@ -113,18 +104,12 @@ def deserialize_kv(mapping_type: type, blob: bytes) -> Mapping:
 
 
 def serialize_defaultdict(df_dict: defaultdict) -> bytes:
-    # relative
-    from .serialize import _serialize
-
     df_type_bytes = _serialize(df_dict.default_factory, to_bytes=True)
     df_kv_bytes = serialize_kv(df_dict)
     return _serialize((df_type_bytes, df_kv_bytes), to_bytes=True)
 
 
 def deserialize_defaultdict(blob: bytes) -> Mapping:
-    # relative
-    from .deserialize import _deserialize
-
     df_tuple = _deserialize(blob, from_bytes=True)
     df_type_bytes, df_kv_bytes = df_tuple[0], df_tuple[1]
     df_type = _deserialize(df_type_bytes, from_bytes=True)
@@ -137,24 +122,15 @@ def deserialize_defaultdict(blob: bytes) -> Mapping:
 
 
 def serialize_enum(enum: Enum) -> bytes:
-    # relative
-    from .serialize import _serialize
-
     return cast(bytes, _serialize(enum.value, to_bytes=True))
 
 
 def deserialize_enum(enum_type: type, enum_buf: bytes) -> Enum:
-    # relative
-    from .deserialize import _deserialize
-
     enum_value = _deserialize(enum_buf, from_bytes=True)
     return enum_type(enum_value)
 
 
 def serialize_type(serialized_type: type) -> bytes:
-    # relative
-    from ..util.util import full_name_with_qualname
-
     fqn = full_name_with_qualname(klass=serialized_type)
     module_parts = fqn.split(".")
     return ".".join(module_parts).encode()
@@ -173,16 +149,10 @@ TPath = TypeVar("TPath", bound=PurePath)
 
 
 def serialize_path(path: PurePath) -> bytes:
-    # relative
-    from .serialize import _serialize
-
     return cast(bytes, _serialize(str(path), to_bytes=True))
 
 
 def deserialize_path(path_type: Type[TPath], buf: bytes) -> TPath:
-    # relative
-    from .deserialize import _deserialize
-
     path: str = _deserialize(buf, from_bytes=True)
     return path_type(path)
 
@@ -311,10 +281,6 @@ for __path_type in (
 
 
 def serialize_generic_alias(serialized_type: _GenericAlias) -> bytes:
-    # relative
-    from ..util.util import full_name_with_name
-    from .serialize import _serialize
-
     fqn = full_name_with_name(klass=serialized_type)
     module_parts = fqn.split(".")
 
@@ -329,9 +295,6 @@ def serialize_generic_alias(serialized_type: _GenericAlias) -> bytes:
 
 
 def deserialize_generic_alias(type_blob: bytes) -> type:
-    # relative
-    from .deserialize import _deserialize
-
     obj_dict = _deserialize(type_blob, from_bytes=True)
     deserialized_type = obj_dict.pop("path")
     module_parts = deserialized_type.split(".")
@@ -1,6 +1,9 @@
 # stdlib
 from typing import Any
 
+# relative
+from .recursive import rs_object2proto
+
 
 def _serialize(
     obj: object,
@@ -8,9 +11,6 @@ def _serialize(
     to_bytes: bool = False,
     for_hashing: bool = False,
 ) -> Any:
-    # relative
-    from .recursive import rs_object2proto
-
     proto = rs_object2proto(obj, for_hashing=for_hashing)
 
     if to_bytes:
@@ -16,6 +16,7 @@ import numpy as np
 from pandas import DataFrame
 from pandas import Series
 from pandas._libs.tslibs.timestamps import Timestamp
+from pandas.api.types import is_numeric_dtype
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pydantic
@@ -88,14 +89,43 @@ recursive_serde_register(
 )
 
 
+def serialize_series(series: Series) -> bytes:
+    # numeric values go through a single column parquet buffer like DataFrame
+    # does, rather than a python dict which is serialized one entry at a time.
+    # object and mixed dtypes arrow can't convert keep using the dict
+    values = None
+    if is_numeric_dtype(series.dtype):
+        # the column name must not clash with an index level name
+        column = "series"
+        while column in series.index.names:
+            column = f"_{column}"
+        try:
+            values = serialize_dataframe(series.to_frame(name=column))
+        except (pa.ArrowException, ValueError):  # nosec
+            pass
+    if values is None:
+        values = series.to_dict()
+    return serialize((values, series.name, str(series.dtype)), to_bytes=True)
+
+
 def deserialize_series(blob: bytes) -> Series:
-    df = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return df[df.columns[0]]
+    obj = deserialize(blob, from_bytes=True)
+    if isinstance(obj, dict):
+        # legacy format: the series as a {name: {index: value}} dict
+        df = DataFrame.from_dict(obj)
+        return df[df.columns[0]]
+    values, name, dtype = obj
+    if isinstance(values, bytes):
+        df = deserialize_dataframe(values)
+        series = df[df.columns[0]]
+        series.name = name
+        return series
+    return Series(values, name=name, dtype=dtype)
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
 )
 
@@ -146,10 +176,12 @@ except Exception:  # nosec
     pass
 
 # jax
+# asarray instead of array: on the host these are views, the array is copied
+# into the serialized bytes (or owned by the deserialized array) anyway
 recursive_serde_register(
     ArrayImpl,
-    serialize=lambda x: serialize(np.array(x), to_bytes=True),
-    deserialize=lambda x: jnp.array(deserialize(x, from_bytes=True)),
+    serialize=lambda x: serialize(np.asarray(x), to_bytes=True),
+    deserialize=lambda x: jnp.asarray(deserialize(x, from_bytes=True)),
 )
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # stdlib
 from enum import Enum
+from functools import partial
 import inspect
 import traceback
 import types
@@ -35,6 +36,7 @@ from ...types.syft_object import SyftBaseObject
 from ...types.syft_object import SyftObject
 from ...types.uid import LineageID
 from ...types.uid import UID
+from ...util.logger import _debug
 from ...util.logger import debug
 from ..response import SyftException
 from .action_data_empty import ActionDataEmpty
@@ -207,6 +209,48 @@ action_data_empty_must_run = [
     "__str__",
 ]
 
+# these are checked on every attribute access, keep a set for the lookups
+passthrough_attrs_set = frozenset(passthrough_attrs)
+dont_wrap_output_attrs_set = frozenset(dont_wrap_output_attrs)
+
+# plain operands of binary ops, these can skip the UID / pointer / ActionObject
+# checks in _syft_prepare_obj_uid
+simple_operand_types = frozenset((int, float, bool, complex, str, bytes, type(None)))
+
+# (type, method name) -> signature of that builtin method, None if it has none
+builtin_method_signatures: Dict[Tuple[type, str], Optional[inspect.Signature]] = {}
+# the cache keeps its types alive, so it is bounded for types created at runtime
+BUILTIN_METHOD_SIGNATURES_MAX_SIZE = 1024
+
+
+def get_builtin_method_signature(
+    obj: Any, name: str, func: Callable
+) -> Optional[inspect.Signature]:
+    """Signature of a builtin bound method, resolved once per type and method"""
+    # methods are wrapped on every attribute access and resolving a builtin
+    # signature parses its __text_signature__, or raises if it has none
+    if isinstance(obj, (type, types.ModuleType)):
+        # every class or module shares the same type, so it is not a usable key
+        try:
+            return inspect.signature(func)
+        except Exception:
+            return None
+
+    key = (type(obj), name)
+    if key in builtin_method_signatures:
+        return builtin_method_signatures[key]
+
+    try:
+        signature = inspect.signature(func)
+    except Exception:
+        signature = None
+
+    if len(builtin_method_signatures) >= BUILTIN_METHOD_SIGNATURES_MAX_SIZE:
+        # evict the oldest entry, dicts keep insertion order
+        del builtin_method_signatures[next(iter(builtin_method_signatures))]
+    builtin_method_signatures[key] = signature
+    return signature
+
 
 class PreHookContext(SyftBaseObject):
     """Hook context
@@ -279,8 +323,9 @@ def trace_action_side_effect(
     context: PreHookContext, *args: Any, **kwargs: Any
 ) -> Result[Ok[Tuple[PreHookContext, Tuple[Any, ...], Dict[str, Any]]], Err[str]]:
     action = context.action
-    if action is not None:
-        TraceResult.result += [action]
+    # only record while a plan is being traced, otherwise this is a no-op
+    if action is not None and TraceResult._client is not None:
+        TraceResult.result.append(action)
     return Ok((context, args, kwargs))
 
 
@@ -359,21 +404,27 @@ def propagate_node_uid(
         - Ok[[result] on success
         - Err[str] on failure
     """
-    if context.op_name in dont_make_side_effects or not hasattr(
-        context.obj, "syft_node_uid"
-    ):
+    if context.op_name in dont_make_side_effects:
         return Ok(result)
 
+    # a single lookup instead of hasattr + getattr, attribute access on an
+    # ActionObject goes through its __getattribute__
     try:
-        syft_node_uid = getattr(context.obj, "syft_node_uid", None)
-        if syft_node_uid is None:
-            raise RuntimeError("Can't proagate node_uid because parent doesnt have one")
+        syft_node_uid = context.obj.syft_node_uid
+    except AttributeError:
+        return Ok(result)
 
-        if op not in context.obj._syft_dont_wrap_attrs():
-            if hasattr(result, "syft_node_uid"):
-                result.syft_node_uid = syft_node_uid
-        else:
-            raise RuntimeError("dont propogate node_uid because output isnt wrapped")
+    # local objects never have a node_uid, this is the common case so return
+    # early instead of raising and formatting a traceback on every op
+    if syft_node_uid is None:
+        return Err("Can't proagate node_uid because parent doesnt have one")
+
+    try:
+        # ops with unwrapped outputs, like __str__ or __bool__, are common too
+        if context.obj._syft_is_dont_wrap_attr(op):
+            return Err("dont propogate node_uid because output isnt wrapped")
+        if hasattr(result, "syft_node_uid"):
+            result.syft_node_uid = syft_node_uid
     except Exception:
         return Err(f"propagate_node_uid failed with {traceback.format_exc()}")
 
@@ -381,21 +432,18 @@ def propagate_node_uid(
 
 
 def debox_args_and_kwargs(args: Any, kwargs: Any) -> Tuple[Any, Any]:
-    filtered_args = []
-    filtered_kwargs = {}
-    for a in args:
-        value = a
-        if hasattr(value, "syft_action_data"):
-            value = value.syft_action_data
-        filtered_args.append(value)
-
-    for k, a in kwargs.items():
-        value = a
-        if hasattr(value, "syft_action_data"):
-            value = value.syft_action_data
-        filtered_kwargs[k] = a
+    # plain python / numpy values are by far the most common operands, a type
+    # check avoids the AttributeError hasattr raises on them. isinstance is not
+    # used as pydantic's instancecheck goes through our __getattribute__
+    filtered_args = tuple(
+        a.syft_action_data if issubclass(type(a), ActionObject) else a for a in args
+    )
+    filtered_kwargs = {
+        k: a.syft_action_data if issubclass(type(a), ActionObject) else a
+        for k, a in kwargs.items()
+    }
 
-    return tuple(filtered_args), filtered_kwargs
+    return filtered_args, filtered_kwargs
 
 
 BASE_PASSTHROUGH_ATTRS = [
@@ -413,6 +461,15 @@ BASE_PASSTHROUGH_ATTRS = [
 ]
 
 
+def attr_list_field(attrs: List[str]) -> Any:
+    """Field defaulting to a copy of attrs
+
+    pydantic deepcopies list defaults for every instance, these class level
+    attr lists are never mutated per object so a shallow copy is enough
+    """
+    return pydantic.Field(default_factory=attrs.copy)
+
+
 class ActionObject(SyftObject):
     """Action object for remote execution."""
 
@@ -435,7 +492,7 @@ class ActionObject(SyftObject):
     _syft_pre_hooks__: Dict[str, List] = {}
     _syft_post_hooks__: Dict[str, List] = {}
     syft_twin_type: TwinMode = TwinMode.NONE
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
     # syft_dont_wrap_attrs = ["shape"]
 
     # @property
@@ -601,22 +658,29 @@ class ActionObject(SyftObject):
         api.services.action.execute(action)
 
     def _syft_prepare_obj_uid(self, obj) -> LineageID:
-        # We got the UID
-        if isinstance(obj, (UID, LineageID)):
-            return LineageID(obj.id)
+        obj_type = type(obj)
+        if obj_type not in simple_operand_types:
+            # We got the UID
+            if issubclass(obj_type, UID):
+                return LineageID(obj.id)
 
-        # We got the ActionObjectPointer
-        if isinstance(obj, ActionObjectPointer):
-            return obj.syft_lineage_id
+            # We got the ActionObjectPointer
+            if issubclass(obj_type, ActionObjectPointer):
+                return obj.syft_lineage_id
 
-        # We got the ActionObject. We need to save it in the store.
-        if isinstance(obj, ActionObject):
-            self._syft_try_to_save_to_store(obj)
-            return obj.syft_lineage_id
+            # We got the ActionObject. We need to save it in the store.
+            if issubclass(obj_type, ActionObject):
+                self._syft_try_to_save_to_store(obj)
+                return obj.syft_lineage_id
 
         # We got a raw object. We need to create the ActionObject from scratch and save it in the store.
         obj_id = Action.make_id(None)
         lin_obj_id = Action.make_result_id(obj_id)
+
+        # plain operands of local objects are never saved, only their id is needed
+        if self.syft_node_uid is None or self.syft_client_verify_key is None:
+            return lin_obj_id
+
         act_obj = ActionObject.from_obj(obj, id=obj_id, syft_lineage_id=lin_obj_id)
 
         self._syft_try_to_save_to_store(act_obj)
@@ -853,35 +917,40 @@ class ActionObject(SyftObject):
 
     def __post_init__(self) -> None:
         """Add pre/post hooks."""
-        if HOOK_ALWAYS not in self._syft_pre_hooks__:
-            self._syft_pre_hooks__[HOOK_ALWAYS] = []
+        # this runs for every new ActionObject and each self lookup goes
+        # through __getattribute__, so only fetch the hook dicts once
+        pre_hooks = self._syft_pre_hooks__
+        post_hooks = self._syft_post_hooks__
+
+        if HOOK_ALWAYS not in pre_hooks:
+            pre_hooks[HOOK_ALWAYS] = []
 
-        if HOOK_ON_POINTERS not in self._syft_post_hooks__:
-            self._syft_pre_hooks__[HOOK_ON_POINTERS] = []
+        if HOOK_ON_POINTERS not in post_hooks:
+            pre_hooks[HOOK_ON_POINTERS] = []
 
         # this should be a list as orders matters
         for side_effect in [make_action_side_effect]:
-            if side_effect not in self._syft_pre_hooks__[HOOK_ALWAYS]:
-                self._syft_pre_hooks__[HOOK_ALWAYS].append(side_effect)
+            if side_effect not in pre_hooks[HOOK_ALWAYS]:
+                pre_hooks[HOOK_ALWAYS].append(side_effect)
 
         for side_effect in [send_action_side_effect]:
-            if side_effect not in self._syft_pre_hooks__[HOOK_ON_POINTERS]:
-                self._syft_pre_hooks__[HOOK_ON_POINTERS].append(side_effect)
+            if side_effect not in pre_hooks[HOOK_ON_POINTERS]:
+                pre_hooks[HOOK_ON_POINTERS].append(side_effect)
 
-        if trace_action_side_effect not in self._syft_pre_hooks__[HOOK_ALWAYS]:
-            self._syft_pre_hooks__[HOOK_ALWAYS].append(trace_action_side_effect)
+        if trace_action_side_effect not in pre_hooks[HOOK_ALWAYS]:
+            pre_hooks[HOOK_ALWAYS].append(trace_action_side_effect)
 
-        if HOOK_ALWAYS not in self._syft_post_hooks__:
-            self._syft_post_hooks__[HOOK_ALWAYS] = []
+        if HOOK_ALWAYS not in post_hooks:
+            post_hooks[HOOK_ALWAYS] = []
 
-        if HOOK_ON_POINTERS not in self._syft_post_hooks__:
-            self._syft_post_hooks__[HOOK_ON_POINTERS] = []
+        if HOOK_ON_POINTERS not in post_hooks:
+            post_hooks[HOOK_ON_POINTERS] = []
 
         for side_effect in [propagate_node_uid]:
-            if side_effect not in self._syft_post_hooks__[HOOK_ALWAYS]:
-                self._syft_post_hooks__[HOOK_ALWAYS].append(side_effect)
+            if side_effect not in post_hooks[HOOK_ALWAYS]:
+                post_hooks[HOOK_ALWAYS].append(side_effect)
 
-        if isinstance(self.syft_action_data, ActionObject):
+        if issubclass(type(self.syft_action_data), ActionObject):
             raise Exception("Nested ActionObjects", self.syft_action_data)
 
         self.syft_history_hash = hash(self.id)
@@ -898,7 +967,11 @@ class ActionObject(SyftObject):
                     context, result_args, result_kwargs = result.ok()
                 else:
                     debug(f"Pre-hook failed with {result.err()}")
-        if name not in self._syft_dont_wrap_attrs():
+
+        # each check goes through __getattribute__, evaluate it once for both
+        # hook groups
+        dont_wrap = self._syft_is_dont_wrap_attr(name)
+        if not dont_wrap:
             if HOOK_ALWAYS in self._syft_pre_hooks__:
                 for hook in self._syft_pre_hooks__[HOOK_ALWAYS]:
                     result = hook(context, *result_args, **result_kwargs)
@@ -908,16 +981,15 @@ class ActionObject(SyftObject):
                         msg = result.err().replace("\\n", "\n")
                         debug(f"Pre-hook failed with {msg}")
 
-        if self.is_pointer:
-            if name not in self._syft_dont_wrap_attrs():
-                if HOOK_ALWAYS in self._syft_pre_hooks__:
-                    for hook in self._syft_pre_hooks__[HOOK_ON_POINTERS]:
-                        result = hook(context, *result_args, **result_kwargs)
-                        if result.is_ok():
-                            context, result_args, result_kwargs = result.ok()
-                        else:
-                            msg = result.err().replace("\\n", "\n")
-                            debug(f"Pre-hook failed with {msg}")
+        if not dont_wrap and self.is_pointer:
+            if HOOK_ALWAYS in self._syft_pre_hooks__:
+                for hook in self._syft_pre_hooks__[HOOK_ON_POINTERS]:
+                    result = hook(context, *result_args, **result_kwargs)
+                    if result.is_ok():
+                        context, result_args, result_kwargs = result.ok()
+                    else:
+                        msg = result.err().replace("\\n", "\n")
+                        debug(f"Pre-hook failed with {msg}")
 
         return context, result_args, result_kwargs
 
@@ -934,7 +1006,8 @@ class ActionObject(SyftObject):
                 else:
                     debug(f"Post hook failed with {result.err()}")
 
-        if name not in self._syft_dont_wrap_attrs():
+        dont_wrap = self._syft_is_dont_wrap_attr(name)
+        if not dont_wrap:
             if HOOK_ALWAYS in self._syft_post_hooks__:
                 for hook in self._syft_post_hooks__[HOOK_ALWAYS]:
                     result = hook(context, name, new_result)
@@ -943,15 +1016,14 @@ class ActionObject(SyftObject):
                     else:
                         debug(f"Post hook failed with {result.err()}")
 
-        if self.is_pointer:
-            if name not in self._syft_dont_wrap_attrs():
-                if HOOK_ALWAYS in self._syft_post_hooks__:
-                    for hook in self._syft_post_hooks__[HOOK_ON_POINTERS]:
-                        result = hook(context, name, new_result)
-                        if result.is_ok():
-                            new_result = result.ok()
-                        else:
-                            debug(f"Post hook failed with {result.err()}")
+        if not dont_wrap and self.is_pointer:
+            if HOOK_ALWAYS in self._syft_post_hooks__:
+                for hook in self._syft_post_hooks__[HOOK_ON_POINTERS]:
+                    result = hook(context, name, new_result)
+                    if result.is_ok():
+                        new_result = result.ok()
+                    else:
+                        debug(f"Post hook failed with {result.err()}")
 
         return new_result
 
@@ -970,13 +1042,11 @@ class ActionObject(SyftObject):
 
         return result
 
-    def _syft_passthrough_attrs(self) -> List[str]:
-        """These attributes are forwarded to the `object` base class."""
-        return passthrough_attrs + getattr(self, "syft_passthrough_attrs", [])
-
-    def _syft_dont_wrap_attrs(self) -> List[str]:
+    def _syft_is_dont_wrap_attr(self, name: str) -> bool:
         """The results from these attributes are ignored from UID patching."""
-        return dont_wrap_output_attrs + getattr(self, "syft_dont_wrap_attrs", [])
+        return name in dont_wrap_output_attrs_set or name in getattr(
+            self, "syft_dont_wrap_attrs", []
+        )
 
     def _syft_get_attr_context(self, name: str) -> Any:
         """Find which instance - Syft ActionObject or the original object - has the requested attribute."""
@@ -993,7 +1063,7 @@ class ActionObject(SyftObject):
 
     def _syft_attr_propagate_ids(self, context, name: str, result: Any) -> Any:
         """Patch the results with the syft_history_hash, node_uid, and result_id."""
-        if name in self._syft_dont_wrap_attrs():
+        if self._syft_is_dont_wrap_attr(name):
             return result
 
         # Wrap as Syft Object
@@ -1073,17 +1143,15 @@ class ActionObject(SyftObject):
 
     def _syft_wrap_attribute_for_methods(self, name: str) -> Any:
         """Handle `__getattribute__` for methods."""
-
-        # check for other types that aren't methods, functions etc
-        def fake_func(*args: Any, **kwargs: Any) -> Any:
-            return ActionDataEmpty(syft_internal_type=self.syft_internal_type)
-
         debug(f"[__getattribute__] Handling method {name} ")
         if (
-            isinstance(self.syft_action_data, ActionDataEmpty)
+            issubclass(type(self.syft_action_data), ActionDataEmpty)
             and name not in action_data_empty_must_run
         ):
-            original_func = fake_func
+            # check for other types that aren't methods, functions etc
+            original_func = partial(
+                action_data_empty_func, syft_internal_type=self.syft_internal_type
+            )
         else:
             original_func = getattr(self.syft_action_data, name)
 
@@ -1101,8 +1169,11 @@ class ActionObject(SyftObject):
                 context, name, args, kwargs
             )
 
-            if has_action_data_empty(args=args, kwargs=kwargs):
-                result = fake_func(*args, **kwargs)
+            if not (args or kwargs or pre_hook_args or pre_hook_kwargs):
+                # most method calls take no arguments, nothing to scan or debox
+                result = original_func()
+            elif has_action_data_empty(args=args, kwargs=kwargs):
+                result = ActionDataEmpty(syft_internal_type=self.syft_internal_type)
             else:
                 original_args, original_kwargs = debox_args_and_kwargs(
                     pre_hook_args, pre_hook_kwargs
@@ -1128,14 +1199,17 @@ class ActionObject(SyftObject):
 
         try:
             wrapper.__doc__ = original_func.__doc__
-            debug(
-                "Found original signature for ",
-                name,
-                inspect.signature(original_func),
-            )
-            wrapper.__ipython_inspector_signature_override__ = inspect.signature(
-                original_func
-            )
+            if inspect.isbuiltin(original_func):
+                signature = get_builtin_method_signature(
+                    self.syft_action_data, name, original_func
+                )
+            else:
+                signature = inspect.signature(original_func)
+            if signature is not None:
+                debug("Found original signature for ", name, signature)
+                wrapper.__ipython_inspector_signature_override__ = signature
+            else:
+                debug("name", name, "has no signature")
         except Exception:
             debug("name", name, "has no signature")
 
@@ -1146,13 +1220,12 @@ class ActionObject(SyftObject):
         kwargs = dict()
         op_name = "__setattr__"
 
-        def fake_func(*args: Any, **kwargs: Any) -> Any:
-            return ActionDataEmpty(syft_internal_type=self.syft_internal_type)
-
-        if isinstance(self.syft_action_data, ActionDataEmpty) or has_action_data_empty(
-            args=args, kwargs=kwargs
-        ):
-            local_func = fake_func
+        if issubclass(
+            type(self.syft_action_data), ActionDataEmpty
+        ) or has_action_data_empty(args=args, kwargs=kwargs):
+            local_func = partial(
+                action_data_empty_func, syft_internal_type=self.syft_internal_type
+            )
         else:
             local_func = getattr(self.syft_action_data, op_name)
 
@@ -1196,7 +1269,11 @@ class ActionObject(SyftObject):
             return object.__getattribute__(self, name)
 
         # third party
-        if name in self._syft_passthrough_attrs():
+        # the shared passthrough attrs (__dict__, id, ...) are the most common
+        # lookups, the set is checked once here and then the per class extras
+        if name in passthrough_attrs_set or name in getattr(
+            self, "syft_passthrough_attrs", []
+        ):
             return object.__getattribute__(self, name)
         context_self = self._syft_get_attr_context(name)
 
@@ -1260,151 +1337,121 @@ class ActionObject(SyftObject):
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         return self.__call__(*args, **kwds)
 
-    def __str__(self) -> str:
-        return self.__str__()
-
-    def __len__(self) -> int:
-        return self.__len__()
-
-    def __getitem__(self, key: Any) -> Any:
-        return self._syft_output_action_object(self.__getitem__(key))
-
-    def __setitem__(self, key: Any, value: Any) -> None:
-        return self.__setitem__(key, value)
-
-    def __contains__(self, key: Any) -> bool:
-        return self.__contains__(key)
-
-    def __bool__(self) -> bool:
-        return self.__bool__()
-
-    def __add__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__add__(other))
-
-    def __sub__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__sub__(other))
-
-    def __mul__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__mul__(other))
-
-    def __matmul__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__matmul__(other))
-
-    def __eq__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__eq__(other))
-
-    def __lt__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__lt__(other))
-
-    def __gt__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__gt__(other))
-
-    def __le__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__le__(other))
-
-    def __ge__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__ge__(other))
-
-    def __delattr__(self, key: Any) -> None:
-        self.__delattr__(key)
-
-    def __delitem__(self, key: Any) -> None:
-        self.__delitem__(key)
-
-    def __invert__(self) -> Any:
-        return self._syft_output_action_object(self.__invert__())
-
-    def __round__(self) -> Any:
-        return self._syft_output_action_object(self.__round__())
-
-    def __pos__(self) -> Any:
-        return self._syft_output_action_object(self.__pos__())
-
-    def __trunc__(self) -> Any:
-        return self._syft_output_action_object(self.__trunc__())
-
-    def __divmod__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__divmod__(other))
-
-    def __floordiv__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__floordiv__(other))
-
-    def __mod__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__mod__(other))
-
-    def __abs__(self) -> Any:
-        return self._syft_output_action_object(self.__abs__())
+    # the remaining dunders are generated from the op tables below the class,
+    # __eq__ is one of them and returns a wrapped result instead of a bool, so
+    # hash by id rather than by value, read without going through the hooks
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, "id"))
 
-    def __neg__(self) -> Any:
-        return self._syft_output_action_object(self.__neg__())
-
-    def __or__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__or__(other))
-
-    def __and__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__and__(other))
-
-    def __xor__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__xor__(other))
-
-    def __pow__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__pow__(other))
-
-    def __truediv__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__truediv__(other))
-
-    def __lshift__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__lshift__(other))
-
-    def __rshift__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rshift__(other))
-
-    def __iter__(self):
-        return self._syft_output_action_object(self.__iter__())
-
-    def __next__(self):
-        return self._syft_output_action_object(self.__next__())
 
+# these forward straight into __getattribute__ and return the raw result
+forwarded_dunder_ops = [
+    "__str__",
+    "__len__",
+    "__setitem__",
+    "__contains__",
+    "__bool__",
+    "__delattr__",
+    "__delitem__",
     # r ops
     # we want the underlying implementation so we should just call into __getattribute__
-    def __radd__(self, other: Any) -> Any:
-        return self.__radd__(other)
+    "__radd__",
+    "__rsub__",
+    "__rmul__",
+    "__rmatmul__",
+    "__rmod__",
+]
 
-    def __rsub__(self, other: Any) -> Any:
-        return self.__rsub__(other)
+# these forward into __getattribute__ and wrap the result in an ActionObject
+wrapped_dunder_ops = [
+    "__getitem__",
+    "__add__",
+    "__sub__",
+    "__mul__",
+    "__matmul__",
+    "__eq__",
+    "__lt__",
+    "__gt__",
+    "__le__",
+    "__ge__",
+    "__invert__",
+    "__round__",
+    "__pos__",
+    "__trunc__",
+    "__divmod__",
+    "__floordiv__",
+    "__mod__",
+    "__abs__",
+    "__neg__",
+    "__or__",
+    "__and__",
+    "__xor__",
+    "__pow__",
+    "__truediv__",
+    "__lshift__",
+    "__rshift__",
+    "__iter__",
+    "__next__",
+    # r ops
+    "__ror__",
+    "__rand__",
+    "__rxor__",
+    "__rpow__",
+    "__rtruediv__",
+    "__rfloordiv__",
+    "__rlshift__",
+    "__rrshift__",
+]
 
-    def __rmul__(self, other: Any) -> Any:
-        return self.__rmul__(other)
 
-    def __rmatmul__(self, other: Any) -> Any:
-        return self.__rmatmul__(other)
+# dunders taking no operand, or a variable number of them, every other op takes
+# exactly one operand
+unary_dunder_ops = {
+    "__str__",
+    "__len__",
+    "__bool__",
+    "__invert__",
+    "__pos__",
+    "__trunc__",
+    "__abs__",
+    "__neg__",
+    "__iter__",
+    "__next__",
+}
+variadic_dunder_ops = {"__setitem__", "__round__", "__pow__", "__rpow__"}
 
-    def __rmod__(self, other: Any) -> Any:
-        return self.__rmod__(other)
 
-    def __ror__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__ror__(other))
+def _syft_make_dunder_op(name: str, wrap_output: bool) -> Callable:
+    """Build a dunder which re-enters __getattribute__ under the same name"""
+    # fixed arity signatures avoid packing and unpacking *args on every op
+    if name in unary_dunder_ops:
 
-    def __rand__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rand__(other))
+        def dunder_op(self: ActionObject) -> Any:
+            result = getattr(self, name)()
+            return self._syft_output_action_object(result) if wrap_output else result
 
-    def __rxor__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rxor__(other))
+    elif name in variadic_dunder_ops:
 
-    def __rpow__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rpow__(other))
+        def dunder_op(self: ActionObject, *args: Any) -> Any:
+            result = getattr(self, name)(*args)
+            return self._syft_output_action_object(result) if wrap_output else result
 
-    def __rtruediv__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rtruediv__(other))
+    else:
 
-    def __rfloordiv__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rfloordiv__(other))
+        def dunder_op(self: ActionObject, other: Any) -> Any:
+            result = getattr(self, name)(other)
+            return self._syft_output_action_object(result) if wrap_output else result
 
-    def __rlshift__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rlshift__(other))
+    dunder_op.__name__ = name
+    dunder_op.__qualname__ = f"ActionObject.{name}"
+    return dunder_op
 
-    def __rrshift__(self, other: Any) -> Any:
-        return self._syft_output_action_object(self.__rrshift__(other))
+
+for _op_name in forwarded_dunder_ops:
+    setattr(ActionObject, _op_name, _syft_make_dunder_op(_op_name, False))
+
+for _op_name in wrapped_dunder_ops:
+    setattr(ActionObject, _op_name, _syft_make_dunder_op(_op_name, True))
 
 
 @serializable()
@@ -1414,7 +1461,7 @@ class AnyActionObject(ActionObject):
 
     syft_internal_type: ClassVar[Type[Any]] = NoneType  # type: ignore
     # syft_passthrough_attrs: List[str] = []
-    syft_dont_wrap_attrs: List[str] = ["__str__", "__repr__"]
+    syft_dont_wrap_attrs: List[str] = attr_list_field(["__str__", "__repr__"])
 
     def __float__(self) -> float:
         return float(self.syft_action_data)
@@ -1427,18 +1474,36 @@ action_types[Any] = AnyActionObject
 
 
 def debug_original_func(name: str, func: Callable) -> None:
-    debug(f"{name} func is:")
-    debug("inspect.isdatadescriptor", inspect.isdatadescriptor(func))
-    debug("inspect.isgetsetdescriptor", inspect.isgetsetdescriptor(func))
-    debug("inspect.isfunction", inspect.isfunction(func))
-    debug("inspect.isbuiltin", inspect.isbuiltin(func))
-    debug("inspect.ismethod", inspect.ismethod(func))
-    debug("inspect.ismethoddescriptor", inspect.ismethoddescriptor(func))
+    # runs on every method access, only inspect func if debug logs are emitted
+    def describe() -> str:
+        checks = [
+            "isdatadescriptor",
+            "isgetsetdescriptor",
+            "isfunction",
+            "isbuiltin",
+            "ismethod",
+            "ismethoddescriptor",
+        ]
+        return "\n".join(
+            f"inspect.{check} {getattr(inspect, check)(func)}" for check in checks
+        )
+
+    # lazy debug logging calls every argument, so name is wrapped as well
+    _debug("{} func is:\n{}", lambda: name, describe)
+
+
+def action_data_empty_func(
+    *args: Any, syft_internal_type: Type[Any], **kwargs: Any
+) -> ActionDataEmpty:
+    # stands in for methods of an ActionObject whose data is not available
+    return ActionDataEmpty(syft_internal_type=syft_internal_type)
 
 
 def is_action_data_empty(obj: Any) -> bool:
-    return isinstance(obj, AnyActionObject) and isinstance(
-        obj.syft_action_data, ActionDataEmpty
+    # checked for every operand, compare types directly instead of going
+    # through pydantic's instancecheck
+    return issubclass(type(obj), AnyActionObject) and issubclass(
+        type(obj.syft_action_data), ActionDataEmpty
     )
 
 
@@ -28,8 +28,11 @@ COMPOUND_ACTION_PERMISSION = set(
 )
 
 
-@serializable()
+@serializable(attrs=["uid", "credentials", "permission"])
 class ActionObjectPermission:
+    # one of these is created for every permission check so keep them small
+    __slots__ = ("uid", "credentials", "permission")
+
     def __init__(
         self,
         uid: UID,
@@ -60,6 +63,8 @@ class ActionObjectPermission:
 
 
 class ActionObjectOWNER(ActionObjectPermission):
+    __slots__ = ()
+
     def __init__(self, uid: UID, credentials: SyftVerifyKey):
         self.uid = uid
         self.credentials = credentials
@@ -67,6 +72,8 @@ class ActionObjectOWNER(ActionObjectPermission):
 
 
 class ActionObjectREAD(ActionObjectPermission):
+    __slots__ = ()
+
     def __init__(self, uid: UID, credentials: SyftVerifyKey):
         self.uid = uid
         self.credentials = credentials
@@ -74,6 +81,8 @@ class ActionObjectREAD(ActionObjectPermission):
 
 
 class ActionObjectWRITE(ActionObjectPermission):
+    __slots__ = ()
+
     def __init__(self, uid: UID, credentials: SyftVerifyKey):
         self.uid = uid
         self.credentials = credentials
@@ -81,6 +90,8 @@ class ActionObjectWRITE(ActionObjectPermission):
 
 
 class ActionObjectEXECUTE(ActionObjectPermission):
+    __slots__ = ()
+
     def __init__(self, uid: UID, credentials: SyftVerifyKey):
         self.uid = uid
         self.credentials = credentials
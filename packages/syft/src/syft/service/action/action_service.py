@@ -3,6 +3,7 @@ import importlib
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -185,15 +186,12 @@ class ActionService(AbstractService):
                 result_action_object = wrap_result(result_id, exec_result.result)
             else:
                 # twins
-                private_kwargs = filter_twin_kwargs(
-                    real_kwargs, twin_mode=TwinMode.PRIVATE
-                )
+                private_kwargs, mock_kwargs = split_twin_kwargs(real_kwargs)
                 private_exec_result = execute_byte_code(code_item, private_kwargs)
                 result_action_object_private = wrap_result(
                     result_id, private_exec_result.result
                 )
 
-                mock_kwargs = filter_twin_kwargs(real_kwargs, twin_mode=TwinMode.MOCK)
                 mock_exec_result = execute_byte_code(code_item, mock_kwargs)
                 result_action_object_mock = wrap_result(
                     result_id, mock_exec_result.result
@@ -217,11 +215,13 @@ class ActionService(AbstractService):
         if set_result.is_err():
             return set_result.err()
 
-        if len(code_item.output_policy.output_readers) > 0:
+        # output_policy deserializes the policy state on every access
+        output_readers = code_item.output_policy.output_readers
+        if len(output_readers) > 0:
             self.store.add_permissions(
                 [
                     ActionObjectPermission(result_id, ActionPermission.READ, x)
-                    for x in code_item.output_policy.output_readers
+                    for x in output_readers
                 ]
             )
 
@@ -324,7 +324,10 @@ class ActionService(AbstractService):
             # result_action_object = Ok(wrap_result(action.result_id, val))
 
     def get_attribute(
-        self, action: Action, resolved_self: Union[ActionObject, TwinObject]
+        self,
+        context: AuthedServiceContext,
+        action: Action,
+        resolved_self: Union[ActionObject, TwinObject],
     ):
         if isinstance(resolved_self, TwinObject):
             private_result = getattr(resolved_self.private.syft_action_data, action.op)
@@ -417,16 +420,10 @@ class ActionService(AbstractService):
                     plan_kwargs=action.kwargs,
                 )
                 return result_action_object
-            elif action.action_type == ActionType.SETATTRIBUTE:
-                result_action_object = self.set_attribute(
-                    context, action, resolved_self
-                )
-            elif action.action_type == ActionType.GETATTRIBUTE:
-                result_action_object = self.get_attribute(action, resolved_self)
-            elif action.action_type == ActionType.METHOD:
-                result_action_object = self.call_method(context, action, resolved_self)
-            else:
+            handler = self._resolved_self_handlers.get(action.action_type, None)
+            if handler is None:
                 return Err("Unknown action")
+            result_action_object = handler(self, context, action, resolved_self)
 
         if result_action_object.is_err():
             return Err(
@@ -459,6 +456,13 @@ class ActionService(AbstractService):
 
         return Ok(result_action_object)
 
+    # handlers for the action types which run against a resolved remote_self
+    _resolved_self_handlers = {
+        ActionType.SETATTRIBUTE: set_attribute,
+        ActionType.GETATTRIBUTE: get_attribute,
+        ActionType.METHOD: call_method,
+    }
+
     def has_read_permission_for_action_result(
         self, context: AuthedServiceContext, action: Action
     ) -> bool:
@@ -560,17 +564,13 @@ def execute_callable(
                 result = target_callable(*filtered_args, **filtered_kwargs)
                 result_action_object = wrap_result(action.result_id, result)
             else:
-                twin_mode = TwinMode.PRIVATE
-                private_args = filter_twin_args(args, twin_mode=twin_mode)
-                private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
+                private_args, mock_args = split_twin_args(args)
+                private_kwargs, mock_kwargs = split_twin_kwargs(kwargs)
                 private_result = target_callable(*private_args, **private_kwargs)
                 result_action_object_private = wrap_result(
                     action.result_id, private_result
                 )
 
-                twin_mode = TwinMode.MOCK
-                mock_args = filter_twin_args(args, twin_mode=twin_mode)
-                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 mock_result = target_callable(*mock_args, **mock_kwargs)
                 result_action_object_mock = wrap_result(action.result_id, mock_result)
 
@@ -620,15 +620,13 @@ def execute_object(
                 result_action_object = wrap_result(action.result_id, result)
             elif twin_mode == TwinMode.NONE and has_twin_inputs:
                 # self isn't a twin but one of the inputs is
-                private_args = filter_twin_args(args, twin_mode=twin_mode)
-                private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
+                private_args, mock_args = split_twin_args(args)
+                private_kwargs, mock_kwargs = split_twin_kwargs(kwargs)
                 private_result = target_method(*private_args, **private_kwargs)
                 result_action_object_private = wrap_result(
                     action.result_id, private_result
                 )
 
-                mock_args = filter_twin_args(args, twin_mode=twin_mode)
-                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 mock_result = target_method(*mock_args, **mock_kwargs)
                 result_action_object_mock = wrap_result(action.result_id, mock_result)
 
@@ -704,6 +702,36 @@ def filter_twin_kwargs(kwargs: Dict, twin_mode: TwinMode) -> Any:
     return filtered
 
 
+def split_twin_args(args: List[Any]) -> Tuple[List[Any], List[Any]]:
+    """Unbox args for the private and the mock execution in a single pass"""
+    private_args = []
+    mock_args = []
+    for arg in args:
+        if isinstance(arg, TwinObject):
+            private_args.append(arg.private.syft_action_data)
+            mock_args.append(arg.mock.syft_action_data)
+        else:
+            value = arg.syft_action_data
+            private_args.append(value)
+            mock_args.append(value)
+    return private_args, mock_args
+
+
+def split_twin_kwargs(kwargs: Dict) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Unbox kwargs for the private and the mock execution in a single pass"""
+    private_kwargs = {}
+    mock_kwargs = {}
+    for k, v in kwargs.items():
+        if isinstance(v, TwinObject):
+            private_kwargs[k] = v.private.syft_action_data
+            mock_kwargs[k] = v.mock.syft_action_data
+        else:
+            value = v.syft_action_data
+            private_kwargs[k] = value
+            mock_kwargs[k] = value
+    return private_kwargs, mock_kwargs
+
+
 TYPE_TO_SERVICE[ActionObject] = ActionService
 TYPE_TO_SERVICE[TwinObject] = ActionService
 TYPE_TO_SERVICE[AnyActionObject] = ActionService
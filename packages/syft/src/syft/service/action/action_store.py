@@ -139,9 +139,7 @@ class KeyValueActionStore(ActionStore):
         if can_write:
             self.data[uid] = syft_object
             if has_result_read_permission:
-                if uid not in self.permissions:
-                    # create default permissions
-                    self.permissions[uid] = set()
+                # missing uids default to an empty set, add_permission writes it back
                 self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
             else:
                 self.add_permissions(
@@ -191,13 +189,12 @@ class KeyValueActionStore(ActionStore):
         if not isinstance(permission.permission, ActionPermission):
             raise Exception(f"ObjectPermission type: {permission.permission} not valid")
 
-        if self.root_verify_key.verify == permission.credentials.verify:
+        # compare the raw keys, .verify hex encodes both sides on every check
+        if self.root_verify_key == permission.credentials:
             return True
 
-        if (
-            permission.uid in self.permissions
-            and permission.permission_string in self.permissions[permission.uid]
-        ):
+        # permissions is a set-defaulting store, a single read covers missing uids
+        if permission.permission_string in self.permissions[permission.uid]:
             return True
 
         # 🟡 TODO 14: add ALL_READ, ALL_EXECUTE etc
@@ -213,7 +210,7 @@ class KeyValueActionStore(ActionStore):
         return False
 
     def has_permissions(self, permissions: List[ActionObjectPermission]) -> bool:
-        return all([self.has_permission(p) for p in permissions])
+        return all(self.has_permission(p) for p in permissions)
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
         permissions = self.permissions[permission.uid]
@@ -226,9 +223,16 @@ class KeyValueActionStore(ActionStore):
         self.permissions[permission.uid] = permissions
 
     def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
-        results = []
+        # read and write back each uid's permission set once, instead of once per
+        # permission, these are usually several permissions for the same uid
+        updated_permissions = {}
         for permission in permissions:
-            results.append(self.add_permission(permission))
+            if permission.uid not in updated_permissions:
+                updated_permissions[permission.uid] = self.permissions[permission.uid]
+            updated_permissions[permission.uid].add(permission.permission_string)
+
+        for uid, uid_permissions in updated_permissions.items():
+            self.permissions[uid] = uid_permissions
 
 
 @serializable()
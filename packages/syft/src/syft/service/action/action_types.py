@@ -17,16 +17,17 @@ def action_type_for_type(obj_or_type: Any) -> Type:
             Can be an object or a class
     """
     if type(obj_or_type) != type:
-        if isinstance(obj_or_type, ActionDataEmpty):
+        if issubclass(type(obj_or_type), ActionDataEmpty):
             obj_or_type = obj_or_type.syft_internal_type
         else:
             obj_or_type = type(obj_or_type)
 
-    if obj_or_type not in action_types:
+    action_type = action_types.get(obj_or_type, None)
+    if action_type is None:
         debug(f"WARNING: No Type for {obj_or_type}, returning {action_types[Any]}")
         return action_types[Any]
 
-    return action_types[obj_or_type]
+    return action_type
 
 
 def action_type_for_object(obj: Any) -> Type:
@@ -38,8 +39,9 @@ def action_type_for_object(obj: Any) -> Type:
     """
     _type = type(obj)
 
-    if _type not in action_types:
+    action_type = action_types.get(_type, None)
+    if action_type is None:
         debug(f"WARNING: No Type for {_type}, returning {action_types[Any]}")
         return action_types[Any]
 
-    return action_types[_type]
+    return action_type
@@ -1,6 +1,7 @@
 # stdlib
 from typing import Any
 from typing import ClassVar
+from typing import List
 from typing import Type
 
 # third party
@@ -11,6 +12,7 @@ from ...serde.serializable import serializable
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from .action_object import ActionObject
 from .action_object import BASE_PASSTHROUGH_ATTRS
+from .action_object import attr_list_field
 from .action_types import action_types
 
 # @serializable(attrs=["id", "node_uid", "parent_id"])
@@ -46,8 +48,8 @@ class NumpyArrayObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
 
     syft_internal_type: ClassVar[Type[Any]] = np.ndarray
     syft_pointer_type = NumpyArrayObjectPointer
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
-    syft_dont_wrap_attrs = ["dtype", "shape"]
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
+    syft_dont_wrap_attrs: List[str] = attr_list_field(["dtype", "shape"])
 
     # def __eq__(self, other: Any) -> bool:
     #     # 🟡 TODO 8: move __eq__ to a Data / Serdeable type interface on ActionObject
@@ -62,8 +64,10 @@ class NumpyArrayObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
         return bool(self.all())
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # asarray hands the wrapped buffer straight to the ufunc, np.array would
+        # allocate a full size copy of every operand on each op
         inputs = tuple(
-            np.array(x.syft_action_data, dtype=x.dtype)
+            np.asarray(x.syft_action_data, dtype=x.dtype)
             if isinstance(x, NumpyArrayObject)
             else x
             for x in inputs
@@ -87,8 +91,8 @@ class NumpyScalarObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
     __version__ = SYFT_OBJECT_VERSION_1
 
     syft_internal_type = np.number
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
-    syft_dont_wrap_attrs = ["dtype", "shape"]
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
+    syft_dont_wrap_attrs: List[str] = attr_list_field(["dtype", "shape"])
 
     def __float__(self) -> float:
         return float(self.syft_action_data)
@@ -100,8 +104,8 @@ class NumpyBoolObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
     __version__ = SYFT_OBJECT_VERSION_1
 
     syft_internal_type = np.bool_
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
-    syft_dont_wrap_attrs = ["dtype", "shape"]
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
+    syft_dont_wrap_attrs: List[str] = attr_list_field(["dtype", "shape"])
 
 
 np_array = np.array([1, 2, 3])
@@ -1,6 +1,7 @@
 # stdlib
 from typing import Any
 from typing import ClassVar
+from typing import List
 from typing import Optional
 from typing import Type
 
@@ -13,6 +14,7 @@ from ...serde.serializable import serializable
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from .action_object import ActionObject
 from .action_object import BASE_PASSTHROUGH_ATTRS
+from .action_object import attr_list_field
 from .action_types import action_types
 
 
@@ -22,22 +24,20 @@ class PandasDataFrameObject(ActionObject):
     __version__ = SYFT_OBJECT_VERSION_1
 
     syft_internal_type: ClassVar[Type[Any]] = DataFrame
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
     # this is added for instance checks for dataframes
     # syft_dont_wrap_attrs = ["shape"]
 
     def __dataframe__(self, *args: Any, **kwargs: Any) -> Any:
         return self.__dataframe__(*args, **kwargs)
 
-    def __getattribute__(self, name: str) -> Any:
-        return super().__getattribute__(name)
-
     def syft_get_property(self, obj: Any, method: str) -> Any:
         return getattr(self.syft_action_data, method)
 
     def syft_is_property(self, obj: Any, method: str) -> bool:
-        cols = self.syft_action_data.columns.values.tolist()
-        if method in cols:
+        # this runs on every attribute access, check the column index directly
+        # instead of copying the column names into a list each time
+        if method in self.syft_action_data.columns:
             return True
         return super().syft_is_property(obj, method)
 
@@ -48,14 +48,11 @@ class PandasSeriesObject(ActionObject):
     __version__ = SYFT_OBJECT_VERSION_1
 
     syft_internal_type = Series
-    syft_passthrough_attrs = BASE_PASSTHROUGH_ATTRS
+    syft_passthrough_attrs: List[str] = attr_list_field(BASE_PASSTHROUGH_ATTRS)
 
     name: Optional[str] = None
     # syft_dont_wrap_attrs = ["shape"]
 
-    def __getattribute__(self, name: str) -> Any:
-        return super().__getattribute__(name)
-
     def syft_get_property(self, obj: Any, method: str) -> Any:
         return getattr(self.syft_action_data, method)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 # stdlib
 import ast
 from enum import Enum
+from functools import lru_cache
 import hashlib
 import inspect
 from io import StringIO
@@ -561,12 +562,18 @@ def debox_asset(arg: Any) -> Any:
     deboxed_arg = arg
     if isinstance(deboxed_arg, Asset):
         asset = deboxed_arg
-        if asset.has_data_permission():
-            return asset.data, ArgumentType.PRIVATE
+        # data is None without permission, so a single fetch answers both the
+        # permission check and the read
+        data = asset.data
+        if data is not None:
+            return data, ArgumentType.PRIVATE
         else:
             return asset.mock, ArgumentType.MOCK
-    if hasattr(deboxed_arg, "syft_action_data"):
+    # a single lookup, hasattr would fetch the data once just to check for it
+    try:
         deboxed_arg = deboxed_arg.syft_action_data
+    except AttributeError:
+        pass
     return deboxed_arg, ArgumentType.REAL
 
 
@@ -703,6 +710,9 @@ def new_check_code(context: TransformContext) -> TransformContext:
     return context
 
 
+# code objects are immutable, so the same parsed code is only compiled once
+# no matter how often it is executed
+@lru_cache(maxsize=128)
 def compile_byte_code(parsed_code: str) -> Optional[PyCodeObject]:
     try:
         return compile(parsed_code, "<string>", "exec")
@@ -100,9 +100,14 @@ class DataSubjectCreate(SyftObject):
         return f"DataSubject({self.name})"
 
     def _create_member_relationship(self, data_subject, _relationship_set):
-        for member in data_subject.members.values():
-            _relationship_set.add((data_subject, member))
-            self._create_member_relationship(member, _relationship_set)
+        # walk the member tree with an explicit stack, deep hierarchies
+        # shouldn't hit the recursion limit
+        stack = [data_subject]
+        while stack:
+            parent = stack.pop()
+            for member in parent.members.values():
+                _relationship_set.add((parent, member))
+                stack.append(member)
 
     def add_member(self, data_subject: Self) -> None:
         self.members[data_subject.name] = data_subject
@@ -125,14 +125,17 @@ class Asset(SyftObject):
             uploaded_by_line = (
                 f"<p><strong>Uploaded by: </strong>{self.uploader.name}</p>"
             )
-        if isinstance(self.data, ActionObject):
+        # data and mock are remote reads, fetch each of them once per render
+        data = self.data
+        mock = self.mock
+        if isinstance(data, ActionObject):
             data_table_line = itables.to_html_datatable(
-                df=self.data.syft_action_data, css=itables_css
+                df=data.syft_action_data, css=itables_css
             )
-        elif isinstance(self.data, pd.DataFrame):
-            data_table_line = itables.to_html_datatable(df=self.data, css=itables_css)
+        elif isinstance(data, pd.DataFrame):
+            data_table_line = itables.to_html_datatable(df=data, css=itables_css)
         else:
-            data_table_line = self.data
+            data_table_line = data
         return f"""
             <style>
             {fonts_css}
@@ -153,7 +156,7 @@ class Asset(SyftObject):
             <p><strong>Data:</strong></p>
             {data_table_line}
             <p><strong>Mock Data:</strong></p>
-            {itables.to_html_datatable(df=self.mock, css=itables_css)}
+            {itables.to_html_datatable(df=mock, css=itables_css)}
             </div>"""
 
     def _repr_markdown_(self) -> str:
@@ -353,10 +356,9 @@ class CreateAsset(SyftObject):
 
 
 def get_shape_or_len(obj: Any) -> Optional[Union[Tuple[int, ...], int]]:
-    if hasattr(obj, "shape"):
-        shape = getattr(obj, "shape", None)
-        if shape:
-            return shape
+    shape = getattr(obj, "shape", None)
+    if shape:
+        return shape
     len_attr = getattr(obj, "__len__", None)
     if len_attr is not None:
         return len_attr()
@@ -267,14 +267,14 @@ def allowed_ids_only(
             f"Invalid Node Type for Code Submission:{context.node.node_type}"
         )
     filtered_kwargs = {}
-    for key in allowed_inputs.keys():
+    for key, allowed_uid in allowed_inputs.items():
         if key in kwargs:
             value = kwargs[key]
             uid = value
             if not isinstance(uid, UID):
                 uid = getattr(value, "id", None)
 
-            if uid != allowed_inputs[key]:
+            if uid != allowed_uid:
                 raise Exception(
                     f"Input {type(value)} for {key} not in allowed {allowed_inputs}"
                 )
@@ -13,6 +13,7 @@ from ...store.document_store import DocumentStore
 from ...store.linked_obj import LinkedObject
 from ...types.uid import UID
 from ...util.telemetry import instrument
+from ...util.util import get_page
 from ..action.action_permissions import ActionObjectPermission
 from ..action.action_permissions import ActionPermission
 from ..context import AuthedServiceContext
@@ -122,22 +123,20 @@ class RequestService(AbstractService):
 
         requests = []
         if result.is_ok():
-            for req in result.ok():
+            reqs = result.ok()
+
+            # If chunk size is defined, then only return that page of requests
+            if page_size:
+                reqs = get_page(reqs, page_size=page_size, page_index=page_index)
+
+            # only look up the user and notification for the returned requests
+            for req in reqs:
                 user = method(req.requesting_user_verify_key).to(UserView)
                 message = get_message(context=context, obj_uid=req.id)
                 requests.append(
                     RequestInfo(user=user, request=req, notification=message)
                 )
 
-            # If chunk size is defined, then split list into evenly sized chunks
-            if page_size:
-                requests = [
-                    requests[i : i + page_size]
-                    for i in range(0, len(requests), page_size)
-                ]
-                # Return the proper slice using chunk_index
-                requests = requests[page_index]
-
             return requests
 
         return SyftError(message=result.err())
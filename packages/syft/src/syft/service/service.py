@@ -108,17 +108,33 @@ class LibConfig(BaseConfig):
 class ServiceConfigRegistry:
     __service_config_registry__: Dict[str, ServiceConfig] = {}
     # __public_to_private_path_map__: Dict[str, str] = {}
+    # role -> configs the role has access to, reset whenever a service registers
+    __role_config_cache__: Dict[ServiceRole, Dict[str, ServiceConfig]] = {}
 
     @classmethod
     def register(cls, config: ServiceConfig) -> None:
         if not cls.path_exists(config.public_path):
             cls.__service_config_registry__[config.public_path] = config
+            cls.__role_config_cache__.clear()
             # cls.__public_to_private_path_map__[config.public_path] = config.private_path
 
     @classmethod
     def get_registered_configs(cls) -> Dict[str, ServiceConfig]:
         return cls.__service_config_registry__
 
+    @classmethod
+    def get_configs_for_role(cls, role: ServiceRole) -> Dict[str, ServiceConfig]:
+        # resolved for every api call, only filter the registry once per role
+        configs = cls.__role_config_cache__.get(role, None)
+        if configs is None:
+            configs = {
+                k: service_config
+                for k, service_config in cls.__service_config_registry__.items()
+                if service_config.has_permission(role)
+            }
+            cls.__role_config_cache__[role] = configs
+        return configs
+
     @classmethod
     def path_exists(cls, path: str):
         return path in cls.__service_config_registry__
@@ -173,13 +189,7 @@ class UserServiceConfigRegistry:
 
     @classmethod
     def from_role(cls, user_service_role: ServiceRole):
-        return cls(
-            {
-                k: service_config
-                for k, service_config in ServiceConfigRegistry.get_registered_configs().items()
-                if service_config.has_permission(user_service_role)
-            }
-        )
+        return cls(ServiceConfigRegistry.get_configs_for_role(user_service_role))
 
     def __contains__(self, path: str):
         return path in self.__service_config_registry__
@@ -246,12 +256,10 @@ def types_for_autosplat(signature: Signature, autosplat: List[str]) -> Dict[str,
 
 def reconstruct_args_kwargs(
     signature: Signature,
-    autosplat: List[str],
+    autosplat_types: Dict[str, type],
     args: Tuple[Any, ...],
     kwargs: Dict[Any, str],
 ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
-    autosplat_types = types_for_autosplat(signature=signature, autosplat=autosplat)
-
     autosplat_objs = {}
     for autosplat_key, autosplat_type in autosplat_types.items():
         init_kwargs = {}
@@ -326,12 +334,16 @@ def service_method(
         signature = signature_remove_context(signature)
 
         input_signature = deepcopy(signature)
+        # resolved once here instead of walking the signature on every call
+        autosplat_types = types_for_autosplat(
+            signature=input_signature, autosplat=autosplat or []
+        )
 
         def _decorator(self, *args, **kwargs):
             if autosplat is not None and len(autosplat) > 0:
                 args, kwargs = reconstruct_args_kwargs(
                     signature=input_signature,
-                    autosplat=autosplat,
+                    autosplat_types=autosplat_types,
                     args=args,
                     kwargs=kwargs,
                 )
@@ -14,6 +14,7 @@ from ...store.document_store import DocumentStore
 from ...types.syft_metaclass import Empty
 from ...types.uid import UID
 from ...util.telemetry import instrument
+from ...util.util import get_page
 from ..action.action_permissions import ActionObjectPermission
 from ..action.action_permissions import ActionPermission
 from ..context import AuthedServiceContext
@@ -111,17 +112,16 @@ class UserService(AbstractService):
         else:
             result = self.stash.get_all(context.credentials)
         if result.is_ok():
-            results = [user.to(UserView) for user in result.ok()]
+            users = result.ok()
+            total = len(users)
 
-            # If chunk size is defined, then split list into evenly sized chunks
+            # If chunk size is defined, then only return that page of users
+            if page_size:
+                users = get_page(users, page_size=page_size, page_index=page_index)
+
+            # only the users that are returned get converted
+            results = [user.to(UserView) for user in users]
             if page_size:
-                total = len(results)
-                results = [
-                    results[i : i + page_size]
-                    for i in range(0, len(results), page_size)
-                ]
-                # Return the proper slice using chunk_index
-                results = results[page_index]
                 results = UserViewPage(users=results, total=total)
             return results
 
@@ -168,17 +168,16 @@ class UserService(AbstractService):
 
         if result.is_err():
             return SyftError(message=str(result.err()))
-        users = result.ok()
-        results = [user.to(UserView) for user in users] if users is not None else []
+        users = result.ok() or []
+        total = len(users)
 
-        # If page size is defined, then split list into evenly sized chunks
+        # If page size is defined, then only return that page of users
+        if page_size:
+            users = get_page(users, page_size=page_size, page_index=page_index)
+
+        # only the users that are returned get converted
+        results = [user.to(UserView) for user in users]
         if page_size:
-            total = len(results)
-            results = [
-                results[i : i + page_size] for i in range(0, len(results), page_size)
-            ]
-            # Return the proper slice using page_index
-            results = results[page_index]
             results = UserViewPage(users=results, total=total)
 
         return results
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 import sys
 import types
 import typing
@@ -111,6 +112,13 @@ class PartitionKey(BaseModel):
         return is_generic_alias(self.type_) and self.type_.__origin__ == list
 
 
+@lru_cache(maxsize=128)
+def _make_partition_key(key: str, type_: Union[type, object]) -> PartitionKey:
+    # the same handful of keys is rebuilt for every query and every set, share
+    # one validated PartitionKey per (key, type_) instead
+    return PartitionKey(key=key, type_=type_)
+
+
 @serializable()
 class PartitionKeys(BaseModel):
     pks: Union[PartitionKey, Tuple[PartitionKey, ...], List[PartitionKey]]
@@ -151,7 +159,11 @@ class QueryKey(PartitionKey):
 
     @property
     def partition_key(self) -> PartitionKey:
-        return PartitionKey(key=self.key, type_=self.type_)
+        try:
+            return _make_partition_key(self.key, self.type_)
+        except TypeError:
+            # unhashable type_, cant be shared
+            return PartitionKey(key=self.key, type_=self.type_)
 
     @staticmethod
     def from_obj(partition_key: PartitionKey, obj: Any) -> QueryKey:
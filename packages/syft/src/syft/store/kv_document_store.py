@@ -149,9 +149,6 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         has_permission: Optional[bool] = False,
     ) -> Result[SyftObject, str]:
-        # relative
-        from ..service.action.action_store import ActionObjectREAD
-
         # if you get something you need READ permission
         read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
 
@@ -253,16 +250,24 @@ class KeyValueStorePartition(StorePartition):
         self.permissions[permission.uid] = permissions
 
     def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
-        results = []
+        # read and write back each uid's permission set once, instead of once per
+        # permission, these are usually several permissions for the same uid
+        updated_permissions = {}
         for permission in permissions:
-            results.append(self.add_permission(permission))
+            if permission.uid not in updated_permissions:
+                updated_permissions[permission.uid] = self.permissions[permission.uid]
+            updated_permissions[permission.uid].add(permission.permission_string)
+
+        for uid, uid_permissions in updated_permissions.items():
+            self.permissions[uid] = uid_permissions
 
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         if not isinstance(permission.permission, ActionPermission):
             raise Exception(f"ObjectPermission type: {permission.permission} not valid")
 
         # TODO: fix for other admins
-        if self.root_verify_key.verify == permission.credentials.verify:
+        # compare the raw keys, .verify hex encodes both sides on every check
+        if self.root_verify_key == permission.credentials:
             return True
 
         if (
@@ -296,9 +301,13 @@ class KeyValueStorePartition(StorePartition):
         order_by: Optional[PartitionKey] = None,
         has_permission: Optional[bool] = False,
     ) -> Result[List[BaseStash.object_type], str]:
-        # this checks permissions
-        res = [self._get(uid, credentials, has_permission) for uid in self.data.keys()]
-        result = [x.ok() for x in res if x.is_ok()]
+        # this checks permissions, objects are fetched and filtered in a single
+        # pass instead of first collecting a Result for every key
+        result = []
+        for uid in self.data.keys():
+            res = self._get(uid, credentials, has_permission)
+            if res.is_ok():
+                result.append(res.ok())
         if order_by is not None:
             result = sorted(result, key=lambda x: getattr(x, order_by.key, ""))
         return Ok(result)
@@ -337,9 +346,9 @@ class KeyValueStorePartition(StorePartition):
         if len(index_qks.all) > 0:
             index_results = self._get_keys_index(qks=index_qks)
             if index_results.is_ok():
-                if ids is None:
-                    ids = index_results.ok()
-                ids = ids.intersection(index_results.ok())
+                # the first result set is taken as is, intersecting it with
+                # itself would only copy it
+                ids = index_results.ok()
             else:
                 errors.append(index_results.err())
 
@@ -350,7 +359,8 @@ class KeyValueStorePartition(StorePartition):
             if search_results.is_ok():
                 if ids is None:
                     ids = search_results.ok()
-                ids = ids.intersection(search_results.ok())
+                else:
+                    ids = ids.intersection(search_results.ok())
             else:
                 errors.append(search_results.err())
 
@@ -517,12 +527,12 @@ class KeyValueStorePartition(StorePartition):
                     # match OR against all keys for this col
                     # the values of the list will be turned into strings in a single key
                     matches = set()
-                    for item in pk_value:
-                        for col_key in ck_col.keys():
-                            if str(item) in col_key:
-                                store_values = ck_col[col_key]
-                                for value in store_values:
-                                    matches.add(value)
+                    # stringify each item once and walk the column in a single
+                    # pass instead of once per item
+                    item_strs = [str(item) for item in pk_value]
+                    for col_key, store_values in ck_col.items():
+                        if any(item_str in col_key for item_str in item_strs):
+                            matches.update(store_values)
                     if len(matches):
                         subsets.append(matches)
                 else:
@@ -72,7 +72,7 @@ class SyftHashableObject:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
+        # DYNAMIC_SYFT_ATTRIBUTES are excluded by the serializer when hashing
         _bytes = serialize(self, to_bytes=True, for_hashing=True)
         return sha256(_bytes).digest()
 
@@ -176,6 +176,7 @@ class SyftObjectRegistry:
 
 
 print_type_cache = defaultdict(list)
+keys_types_cache: Dict[Tuple[type, str], Dict[str, type]] = {}
 
 
 class SyftObject(SyftBaseObject, SyftObjectRegistry):
@@ -349,7 +350,8 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
             return self.dict()
         else:
             new_dict = {}
-            for k, v in dict(self).items():
+            # iterate the fields directly, dict(self) would build a throwaway copy
+            for k, v in self:
                 # exclude dynamically added syft attributes
                 if k in DYNAMIC_SYFT_ATTRIBUTES:
                     continue
@@ -421,6 +423,11 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
 
     @classmethod
     def _syft_keys_types_dict(cls, attr_name: str) -> Dict[str, type]:
+        # the keys and their types are fixed per class, so only resolve them once
+        cache_key = (cls, attr_name)
+        if cache_key in keys_types_cache:
+            return dict(keys_types_cache[cache_key])
+
         kt_dict = {}
         for key in getattr(cls, attr_name, []):
             if key in cls.__fields__:
@@ -441,7 +448,8 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
             if type(type_) is type and issubclass(type_, EmailStr):
                 type_ = str
             kt_dict[key] = type_
-        return kt_dict
+        keys_types_cache[cache_key] = kt_dict
+        return dict(kt_dict)
 
     @classmethod
     def _syft_unique_keys_dict(cls) -> Dict[str, type]:
@@ -497,8 +505,8 @@ def get_repr_values_table(_self, is_homogenous, extra_fields=None):
             ret_val = item._coll_repr_()
             if "id" in ret_val:
                 del ret_val["id"]
-            for key in ret_val.keys():
-                cols[key].append(ret_val[key])
+            for key, value in ret_val.items():
+                cols[key].append(value)
         else:
             for field in extra_fields:
                 value = item
@@ -684,36 +692,41 @@ def attach_attribute_to_syft_object(result: Any, attr_dict: Dict[str, Any]) -> A
         box_to_result_type = type(result)
         result = result.value
 
-    single_entity = False
-    is_tuple = isinstance(result, tuple)
+    # walk the object graph with an explicit stack, objects reachable through
+    # several fields are only updated once and deep graphs can't hit the
+    # recursion limit
+    visited = set()
+    stack = [result]
+    while stack:
+        value = stack.pop()
+        # boxed fields are updated in place inside their box
+        if type(value) in OkErr:
+            value = value.value
+
+        # the objects are updated in place, so containers are walked as they
+        # are instead of being copied into a new list
+        if isinstance(value, (list, tuple)):
+            values = value
+        elif isinstance(value, dict):
+            values = value.values()
+        else:
+            values = (value,)
+
+        for _object in values:
+            # if object is SyftBaseObject,
+            # then attach the value to the attribute
+            # on the object
+            if issubclass(type(_object), SyftBaseObject):
+                if id(_object) in visited:
+                    continue
+                visited.add(id(_object))
+
+                for attr_name, attr_value in attr_dict.items():
+                    setattr(_object, attr_name, attr_value)
+
+                stack.extend(_object.__dict__.values())
 
-    if isinstance(result, (list, tuple)):
-        iterable_keys = range(len(result))
-        result = list(result)
-    elif isinstance(result, dict):
-        iterable_keys = result.keys()
-    else:
-        iterable_keys = range(1)
-        result = [result]
-        single_entity = True
-
-    for key in iterable_keys:
-        _object = result[key]
-        # if object is SyftBaseObject,
-        # then attach the value to the attribute
-        # on the object
-        if isinstance(_object, SyftBaseObject):
-            for attr_name, attr_value in attr_dict.items():
-                setattr(_object, attr_name, attr_value)
-
-            for field_name, attr in _object.__dict__.items():
-                updated_attr = attach_attribute_to_syft_object(attr, attr_dict)
-                setattr(_object, field_name, updated_attr)
-        result[key] = _object
-
-    wrapped_result = result[0] if single_entity else result
-    wrapped_result = tuple(wrapped_result) if is_tuple else wrapped_result
     if box_to_result_type is not None:
-        wrapped_result = box_to_result_type(wrapped_result)
+        result = box_to_result_type(result)
 
-    return wrapped_result
+    return result
@@ -74,8 +74,7 @@ def make_set_default(key: str, value: Any) -> Callable:
 def drop(list_keys: List[str]) -> Callable:
     def drop_keys(context: TransformContext) -> TransformContext:
         for key in list_keys:
-            if key in context.output:
-                del context.output[key]
+            context.output.pop(key, None)
         return context
 
     return drop_keys
@@ -84,8 +83,7 @@ def drop(list_keys: List[str]) -> Callable:
 def rename(old_key: str, new_key: str) -> Callable:
     def drop_keys(context: TransformContext) -> TransformContext:
         context.output[new_key] = geteitherattr(context.obj, context.output, old_key)
-        if old_key in context.output:
-            del context.output[old_key]
+        context.output.pop(old_key, None)
         return context
 
     return drop_keys
@@ -142,7 +142,8 @@ class UID:
 
     @property
     def no_dash(self) -> str:
-        return str(self.value).replace("-", "")
+        # same string as str(self.value) without dashes, without building it
+        return self.value.hex
 
     def __repr__(self) -> str:
         """Returns a human-readable version of the ID
@@ -205,6 +206,7 @@ class UID:
 class LineageID(UID):
     """Extended UID containing a history hash as well, which is used for comparisons."""
 
+    __slots__ = "syft_history_hash"
     syft_history_hash: int
 
     def __init__(
@@ -231,8 +233,9 @@ class LineageID(UID):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, LineageID):
+            # compare the values directly, .id builds a new UID on every access
             return (
-                self.id == other.id
+                self.value == other.value
                 and self.syft_history_hash == other.syft_history_hash
             )
         elif isinstance(other, UID):
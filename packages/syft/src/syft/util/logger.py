@@ -123,7 +123,7 @@ def info(*args: Any, **kwargs: Any) -> None:
 
 
 def debug(*args) -> None:
-    debug_msg = " ".join([str(a) for a in args])
+    debug_msg = " ".join(map(str, args))
     return logger.debug(debug_msg)
 
 
@@ -241,6 +241,21 @@ def split_rows(rows: Sequence, cpu_count: int) -> List:
     return output
 
 
+def get_page(items: Sequence, page_size: int, page_index: int) -> Sequence:
+    """Slice page `page_index` out of `items` split into pages of `page_size`.
+
+    Behaves like indexing the list of all pages, without building it: a negative
+    page_index counts from the last page, and a page_index outside of the pages
+    (any page of an empty list included) raises an IndexError.
+    """
+    page_count = -(-len(items) // page_size)
+    if not -page_count <= page_index < page_count:
+        raise IndexError(f"page_index {page_index} out of range for {page_count} pages")
+    if page_index < 0:
+        page_index += page_count
+    return items[page_index * page_size : (page_index + 1) * page_size]
+
+
 def list_sum(*inp_lst: List[Any]) -> Any:
     s = inp_lst[0]
     for i in inp_lst[1:]:
@@ -368,9 +383,9 @@ def get_subclasses(obj_type: type) -> List[type]:
 
 
 def index_modules(a_dict: object, keys: List[str]) -> object:
-    """Recursively find a syft module from its path
+    """Find a syft module from its path
 
-    This is the recursive inner function of index_syft_by_module_name.
+    This is the inner function of index_syft_by_module_name.
     See that method for a full description.
 
     Args:
@@ -382,9 +397,9 @@ def index_modules(a_dict: object, keys: List[str]) -> object:
 
     """
 
-    if len(keys) == 0:
-        return a_dict
-    return index_modules(a_dict=a_dict.__dict__[keys[0]], keys=keys[1:])
+    for key in keys:
+        a_dict = a_dict.__dict__[key]
+    return a_dict
 
 
 def index_syft_by_module_name(fully_qualified_name: str) -> object:
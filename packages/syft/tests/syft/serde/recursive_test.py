@@ -0,0 +1,32 @@
+# syft absolute
+import syft as sy
+from syft.serde import recursive
+from syft.serde.recursive import chunk_bytes
+from syft.serde.recursive import combine_bytes
+from syft.serde.recursive import recursive_scheme
+
+
+def test_chunk_bytes_multiple_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(recursive, "CHUNK_SIZE", 10)
+    data = bytes(range(256)) * 4 + b"tail"
+
+    message = recursive_scheme.new_message()
+    chunk_bytes(data, "nonrecursiveBlob", message)
+
+    chunks = message.nonrecursiveBlob
+    assert len(chunks) == len(data) // 10 + 1
+    assert all(len(chunk) == 10 for chunk in list(chunks)[:-1])
+    assert combine_bytes(chunks) == data
+
+    # the chunks survive a round trip through the capnp message bytes
+    with recursive_scheme.from_bytes(message.to_bytes()) as msg:
+        assert combine_bytes(msg.nonrecursiveBlob) == data
+
+
+def test_serde_multiple_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(recursive, "CHUNK_SIZE", 16)
+    obj = {"key": b"x" * 100, "values": list(range(50)), "text": "y" * 40}
+
+    blob = sy.serialize(obj, to_bytes=True)
+
+    assert sy.deserialize(blob, from_bytes=True) == obj
@@ -0,0 +1,43 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.third_party import deserialize_series
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 2, 3], name="ints"),
+        pd.Series([1.5, None, 3.0], index=["x", "y", "z"], name="floats"),
+        pd.Series([True, False]),
+        pd.Series([1, None], dtype="Int64", index=[10, 20], name="nullable"),
+        pd.Series([1 + 2j, 3j], name="complex"),
+        pd.Series(np.array([1, 2], dtype=np.float16)),
+        pd.Series(pd.date_range("2020-01-01", periods=2), name="dates"),
+        pd.Series([1, "a"], name="mixed"),
+        pd.Series([1, 2], dtype=object, index=["a", "b"]),
+        pd.Series(["a", "b", "a"], dtype="category", name="categories"),
+        pd.Series([[1, 2], {"a": 1}], name="python_objects"),
+        pd.Series([1, 2], index=pd.Index(["a", "b"], name="series"), name="x"),
+    ],
+)
+def test_series_serde(series: pd.Series) -> None:
+    deserialized = sy.deserialize(sy.serialize(series, to_bytes=True), from_bytes=True)
+
+    assert deserialized.name == series.name
+    assert deserialized.dtype == series.dtype
+    pd.testing.assert_index_equal(deserialized.index, series.index)
+    pd.testing.assert_series_equal(deserialized, series)
+
+
+def test_series_legacy_dict_format() -> None:
+    series = pd.Series([1.5, 2.5], index=["x", "y"], name="floats")
+    legacy_blob = sy.serialize(pd.DataFrame(series).to_dict(), to_bytes=True)
+
+    deserialized = deserialize_series(legacy_blob)
+
+    pd.testing.assert_series_equal(deserialized, series)
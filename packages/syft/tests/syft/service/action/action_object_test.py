@@ -9,11 +9,13 @@ from typing import Tuple
 from typing import Type
 
 # third party
+from loguru import logger
 import numpy as np
 import pandas as pd
 import pytest
 
 # syft absolute
+from syft.service.action import action_object
 from syft.service.action.action_data_empty import ActionDataEmpty
 from syft.service.action.action_object import Action
 from syft.service.action.action_object import ActionObject
@@ -21,6 +23,7 @@ from syft.service.action.action_object import ActionType
 from syft.service.action.action_object import HOOK_ALWAYS
 from syft.service.action.action_object import HOOK_ON_POINTERS
 from syft.service.action.action_object import PreHookContext
+from syft.service.action.action_object import get_builtin_method_signature
 from syft.service.action.action_object import make_action_side_effect
 from syft.service.action.action_object import propagate_node_uid
 from syft.service.action.action_object import send_action_side_effect
@@ -312,6 +315,20 @@ def test_actionobject_hooks_propagate_node_uid_ok():
     assert result.is_ok()
 
 
+def test_actionobject_hooks_propagate_node_uid_dont_wrap_err():
+    obj = ActionObject.from_obj("abc")
+    obj.syft_point_to(Action.make_id(None))
+
+    op = "__str__"
+    assert obj._syft_is_dont_wrap_attr(op)
+
+    context = PreHookContext(obj=obj, op_name=op)
+    result = propagate_node_uid(context, op=op, result="orig_obj")
+    assert result.is_err()
+    assert "isnt wrapped" in result.err()
+    assert "Traceback" not in result.err()
+
+
 def test_actionobject_syft_point_to():
     orig_obj = "abc"
 
@@ -1013,3 +1030,62 @@ def test_actionobject_syft_getattr_pandas(worker):
 
     obj.columns = ["a", "b", "c"]
     assert obj.columns == ["a", "b", "c"]
+
+
+def test_actionobject_hash_by_id():
+    obj = ActionObject.from_obj(np.array([1, 2, 3]))
+    other = ActionObject.from_obj(np.array([1, 2, 3]))
+
+    assert hash(obj) == hash(obj.id)
+    assert len({obj, other}) == 2
+    assert {obj: True}[obj]
+
+
+def test_actionobject_method_with_debug_logging():
+    messages = []
+    handler_id = logger.add(messages.append, level="DEBUG")
+    try:
+        obj = ActionObject.from_obj(np.array([1, 2, 3]))
+        assert obj.sum() == 6
+    finally:
+        logger.remove(handler_id)
+
+    assert any("sum func is:" in message for message in messages)
+
+
+def test_get_builtin_method_signature_cached(monkeypatch):
+    monkeypatch.setattr(action_object, "builtin_method_signatures", {})
+
+    first = get_builtin_method_signature("abc", "upper", "abc".upper)
+    # a second instance of the same type hits the cache
+    second = get_builtin_method_signature("xyz", "upper", "xyz".upper)
+
+    assert first == inspect.signature("abc".upper)
+    assert second is first
+
+
+def test_get_builtin_method_signature_cache_bounded(monkeypatch):
+    monkeypatch.setattr(action_object, "builtin_method_signatures", {})
+    monkeypatch.setattr(action_object, "BUILTIN_METHOD_SIGNATURES_MAX_SIZE", 2)
+
+    for name in ["upper", "lower", "strip"]:
+        get_builtin_method_signature("abc", name, getattr("abc", name))
+
+    assert list(action_object.builtin_method_signatures) == [
+        (str, "lower"),
+        (str, "strip"),
+    ]
+
+
+def test_get_builtin_method_signature_not_cached_for_classes(monkeypatch):
+    monkeypatch.setattr(action_object, "builtin_method_signatures", {})
+
+    # str.maketrans has no signature while bytes.maketrans does
+    str_signature = get_builtin_method_signature(str, "maketrans", str.maketrans)
+    bytes_signature = get_builtin_method_signature(
+        bytes, "maketrans", bytes.maketrans
+    )
+
+    assert str_signature is None
+    assert bytes_signature == inspect.signature(bytes.maketrans)
+    assert action_object.builtin_method_signatures == {}
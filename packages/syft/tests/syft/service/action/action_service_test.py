@@ -1,10 +1,14 @@
 # stdlib
 
 # third party
+import numpy as np
 
 # syft absolute
 from syft.service.action.action_object import ActionObject
+from syft.service.action.action_service import split_twin_args
+from syft.service.action.action_service import split_twin_kwargs
 from syft.service.context import AuthedServiceContext
+from syft.types.twin_object import TwinObject
 
 # TODO: Improve ActionService testing
 
@@ -23,3 +27,21 @@ def test_action_service_sanity(worker):
     assert len(service.store.data) == 1
     res = pointer.capitalize()
     assert res[0] == "A"
+
+
+def test_split_twin_args_and_kwargs():
+    twin = TwinObject(
+        private_obj=np.array([3, 3, 3]),
+        mock_obj=np.array([1, 1, 1]),
+    )
+    obj = ActionObject.from_obj(2)
+
+    private_args, mock_args = split_twin_args([twin, obj])
+    assert all(private_args[0] == [3, 3, 3])
+    assert all(mock_args[0] == [1, 1, 1])
+    assert private_args[1] == mock_args[1] == 2
+
+    private_kwargs, mock_kwargs = split_twin_kwargs({"x": twin, "y": obj})
+    assert all(private_kwargs["x"] == [3, 3, 3])
+    assert all(mock_kwargs["x"] == [1, 1, 1])
+    assert private_kwargs["y"] == mock_kwargs["y"] == 2
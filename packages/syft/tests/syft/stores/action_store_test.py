@@ -137,3 +137,44 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_action_store"),
+        pytest.lazy_fixture("sqlite_action_store"),
+    ],
+)
+@pytest.mark.flaky(reruns=3, reruns_delay=1)
+def test_action_store_add_permissions(store: Any):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    hacker_key = SyftVerifyKey.from_string(test_verify_key_string_hacker)
+
+    uid = UID()
+    other_uid = UID()
+    # several permissions for one uid, mixed with another uid
+    added = [
+        ActionObjectREAD(uid=uid, credentials=client_key),
+        ActionObjectWRITE(uid=other_uid, credentials=hacker_key),
+        ActionObjectWRITE(uid=uid, credentials=client_key),
+        ActionObjectEXECUTE(uid=uid, credentials=hacker_key),
+    ]
+    store.add_permission(ActionObjectOWNER(uid=uid, credentials=client_key))
+    store.add_permissions(added)
+
+    for permission in added:
+        assert store.has_permission(permission)
+    # permissions set before the batch are kept
+    assert store.has_permission(ActionObjectOWNER(uid=uid, credentials=client_key))
+
+    assert not store.has_permission(
+        ActionObjectEXECUTE(uid=uid, credentials=client_key)
+    )
+    assert not store.has_permission(ActionObjectREAD(uid=uid, credentials=hacker_key))
+    assert not store.has_permission(
+        ActionObjectREAD(uid=other_uid, credentials=hacker_key)
+    )
+    assert not store.has_permission(
+        ActionObjectWRITE(uid=other_uid, credentials=client_key)
+    )
@@ -6,11 +6,19 @@ from threading import Thread
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftVerifyKey
+from syft.service.action.action_permissions import ActionObjectEXECUTE
+from syft.service.action.action_permissions import ActionObjectOWNER
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionObjectWRITE
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
 from syft.store.kv_document_store import KeyValueStorePartition
+from syft.types.uid import UID
 
 # relative
+from .store_constants_test import test_verify_key_string_client
+from .store_constants_test import test_verify_key_string_hacker
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockStoreConfig
 from .store_mocks_test import MockSyftObject
@@ -279,3 +287,44 @@ def test_kv_store_partition_set_delete_multithreaded(
     assert execution_err is None
     stored_cnt = len(kv_store_partition.all(root_verify_key).ok())
     assert stored_cnt == 0
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_store_partition"),
+        pytest.lazy_fixture("sqlite_store_partition"),
+    ],
+)
+@pytest.mark.flaky(reruns=3, reruns_delay=1)
+def test_kv_store_partition_add_permissions(store: KeyValueStorePartition) -> None:
+    res = store.init_store()
+    assert res.is_ok()
+
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    hacker_key = SyftVerifyKey.from_string(test_verify_key_string_hacker)
+
+    uid = UID()
+    other_uid = UID()
+    # several permissions for one uid, mixed with another uid
+    added = [
+        ActionObjectREAD(uid=uid, credentials=client_key),
+        ActionObjectWRITE(uid=other_uid, credentials=hacker_key),
+        ActionObjectWRITE(uid=uid, credentials=client_key),
+        ActionObjectEXECUTE(uid=uid, credentials=hacker_key),
+    ]
+    store.add_permission(ActionObjectOWNER(uid=uid, credentials=client_key))
+    store.add_permissions(added)
+
+    for permission in added:
+        assert store.has_permission(permission)
+    # permissions set before the batch are kept
+    assert store.has_permission(ActionObjectOWNER(uid=uid, credentials=client_key))
+
+    assert not store.has_permission(
+        ActionObjectEXECUTE(uid=uid, credentials=client_key)
+    )
+    assert not store.has_permission(ActionObjectREAD(uid=uid, credentials=hacker_key))
+    assert not store.has_permission(
+        ActionObjectWRITE(uid=other_uid, credentials=client_key)
+    )
@@ -0,0 +1,108 @@
+# stdlib
+from typing import Any
+from typing import Optional
+
+# third party
+from result import Err
+from result import Ok
+
+# syft absolute
+from syft.types.syft_object import SyftBaseObject
+from syft.types.syft_object import attach_attribute_to_syft_object
+from syft.types.uid import UID
+
+
+class MockNode(SyftBaseObject):
+    __canonical_name__ = "MockNode"
+    __version__ = 1
+
+    name: str
+    child: Optional[Any] = None
+
+
+ATTR_DICT = {"syft_node_location": UID()}
+
+
+def is_attached(obj: MockNode) -> bool:
+    return obj.syft_node_location == ATTR_DICT["syft_node_location"]
+
+
+def test_attach_attribute_single_object():
+    obj = MockNode(name="single")
+
+    result = attach_attribute_to_syft_object(obj, ATTR_DICT)
+
+    assert result is obj
+    assert is_attached(obj)
+
+
+def test_attach_attribute_nested_containers():
+    in_list = MockNode(name="in_list")
+    in_dict = MockNode(name="in_dict")
+    in_tuple = MockNode(name="in_tuple")
+    grandchild = MockNode(name="grandchild")
+    in_list.child = grandchild
+    parent_list = MockNode(name="parent_list", child=[in_list])
+    parent_dict = MockNode(name="parent_dict", child={"key": in_dict})
+    parent_tuple = MockNode(name="parent_tuple", child=(in_tuple,))
+
+    attach_attribute_to_syft_object([parent_list, parent_dict, parent_tuple], ATTR_DICT)
+
+    for obj in [parent_list, parent_dict, parent_tuple]:
+        assert is_attached(obj)
+    for obj in [in_list, in_dict, in_tuple, grandchild]:
+        assert is_attached(obj)
+
+    # containers are kept as they are, tuples stay tuples
+    assert parent_tuple.child == (in_tuple,)
+    assert isinstance(parent_tuple.child, tuple)
+    assert parent_list.child == [in_list]
+    assert parent_dict.child == {"key": in_dict}
+
+
+def test_attach_attribute_top_level_containers():
+    objs = (MockNode(name="a"), MockNode(name="b"))
+
+    tuple_result = attach_attribute_to_syft_object(objs, ATTR_DICT)
+    assert isinstance(tuple_result, tuple)
+    assert list(tuple_result) == list(objs)
+
+    dict_result = attach_attribute_to_syft_object({"a": objs[0]}, ATTR_DICT)
+    assert dict_result == {"a": objs[0]}
+
+    assert all(is_attached(obj) for obj in objs)
+
+
+def test_attach_attribute_result_boxes():
+    ok_child = MockNode(name="ok_child")
+    err_child = MockNode(name="err_child")
+    parent = MockNode(name="parent", child=Ok(ok_child))
+    other = MockNode(name="other", child=Err(err_child))
+
+    ok_result = attach_attribute_to_syft_object(Ok([parent, other]), ATTR_DICT)
+    assert isinstance(ok_result, Ok)
+    assert ok_result.ok() == [parent, other]
+
+    err_result = attach_attribute_to_syft_object(Err(MockNode(name="e")), ATTR_DICT)
+    assert isinstance(err_result, Err)
+    assert is_attached(err_result.err())
+
+    assert isinstance(parent.child, Ok) and parent.child.ok() is ok_child
+    assert isinstance(other.child, Err) and other.child.err() is err_child
+    for obj in [parent, other, ok_child, err_child]:
+        assert is_attached(obj)
+
+
+def test_attach_attribute_shared_and_cyclic_objects():
+    shared = MockNode(name="shared")
+    first = MockNode(name="first", child=shared)
+    second = MockNode(name="second", child=[shared])
+    # a cycle back to the first parent terminates
+    shared.child = first
+
+    attach_attribute_to_syft_object([first, second], ATTR_DICT)
+
+    for obj in [first, second, shared]:
+        assert is_attached(obj)
+    assert first.child is shared
+    assert second.child[0] is shared
@@ -7,6 +7,7 @@ from unittest import mock
 
 # third party
 from faker import Faker
+import pytest
 from pytest import MonkeyPatch
 from result import Err
 from result import Ok
@@ -24,6 +25,7 @@ from syft.service.user.user import UserCreate
 from syft.service.user.user import UserPrivateKey
 from syft.service.user.user import UserUpdate
 from syft.service.user.user import UserView
+from syft.service.user.user import UserViewPage
 from syft.service.user.user_roles import ServiceRole
 from syft.service.user.user_service import UserService
 from syft.types.uid import UID
@@ -195,6 +197,38 @@ def test_userservice_get_all_success(
     assert response == expected_output
 
 
+def test_userservice_get_all_paging(
+    monkeypatch: MonkeyPatch,
+    user_service: UserService,
+    authed_context: AuthedServiceContext,
+    guest_user: User,
+    admin_user: User,
+) -> None:
+    mock_get_all_output = [guest_user, admin_user, guest_user]
+    expected_output = [x.to(UserView) for x in mock_get_all_output]
+
+    def mock_get_all(credentials: SyftVerifyKey, **kwargs) -> Ok:
+        return Ok(mock_get_all_output)
+
+    monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)
+
+    response = user_service.get_all(authed_context, page_size=2, page_index=0)
+    assert isinstance(response, UserViewPage)
+    assert response.total == 3
+    assert response.users == expected_output[:2]
+
+    # the last page only has the remaining users
+    response = user_service.get_all(authed_context, page_size=2, page_index=1)
+    assert response.total == 3
+    assert response.users == expected_output[2:]
+
+    response = user_service.get_all(authed_context, page_size=2, page_index=-1)
+    assert response.users == expected_output[2:]
+
+    with pytest.raises(IndexError):
+        user_service.get_all(authed_context, page_size=2, page_index=2)
+
+
 def test_userservice_get_all_error(
     monkeypatch: MonkeyPatch,
     user_service: UserService,
@@ -258,6 +292,41 @@ def test_userservice_search(
     assert response == expected_output
 
 
+def test_userservice_search_paging(
+    monkeypatch: MonkeyPatch,
+    user_service: UserService,
+    authed_context: AuthedServiceContext,
+    guest_user: User,
+    admin_user: User,
+) -> None:
+    mock_find_all_output = [guest_user, admin_user, guest_user]
+    expected_output = [x.to(UserView) for x in mock_find_all_output]
+
+    def mock_find_all(credentials: SyftVerifyKey, **kwargs) -> Ok:
+        return Ok(mock_find_all_output)
+
+    monkeypatch.setattr(user_service.stash, "find_all", mock_find_all)
+
+    response = user_service.search(
+        authed_context, name=guest_user.name, page_size=2, page_index=1
+    )
+    assert isinstance(response, UserViewPage)
+    assert response.total == 3
+    assert response.users == expected_output[2:]
+
+    with pytest.raises(IndexError):
+        user_service.search(
+            authed_context, name=guest_user.name, page_size=2, page_index=2
+        )
+
+    # no results has no pages
+    mock_find_all_output.clear()
+    with pytest.raises(IndexError):
+        user_service.search(
+            authed_context, name=guest_user.name, page_size=2, page_index=0
+        )
+
+
 def test_userservice_search_with_invalid_kwargs(
     user_service: UserService, authed_context: AuthedServiceContext
 ) -> None:
@@ -232,6 +232,20 @@ def test_worker_serde() -> None:
     assert de.id == worker.id
 
 
+def test_worker_serde_after_api_call() -> None:
+    worker = Worker()
+    root_client = worker.root_client
+    assert not isinstance(root_client.api.services.user.get_all(), SyftError)
+
+    # hashing a client serializes its node
+    assert hash(root_client) == hash(root_client)
+
+    ser = sy.serialize(worker, to_bytes=True)
+    de = sy.deserialize(ser, from_bytes=True)
+
+    assert de.id == worker.id
+
+
 @pytest.mark.parametrize(
     "path, kwargs",
     [